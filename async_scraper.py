@@ -0,0 +1,153 @@
+import asyncio
+import random
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from rich.console import Console
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+import parsers
+from constants import (HTTP_HEADERS, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+                       HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX,
+                       HTTP_RETRY_STATUSES, ASYNC_MAX_CONCURRENCY, SCHEDULER_THROTTLE_STATUSES)
+from http_cache import HttpResponseStore
+from rate_limiter import HostScheduler, get_shared_scheduler
+from themes import CUSTOM_THEME
+from transport import CircuitBreaker, parse_retry_after
+
+console = Console(theme=CUSTOM_THEME)
+
+class AsyncScraper:
+
+    def __init__(self, max_concurrency: int = ASYNC_MAX_CONCURRENCY, per_host: Optional[int] = None,
+                 scheduler: Optional[HostScheduler] = None):
+        if httpx is None:
+            raise RuntimeError("AsyncScraper membutuhkan paket 'httpx' (pip install httpx).")
+        self.client = httpx.AsyncClient(
+            headers=HTTP_HEADERS,
+            follow_redirects=True,
+            timeout=httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+        self.http_store = HttpResponseStore()
+        self.per_host = per_host or max_concurrency
+        self.scheduler = scheduler or get_shared_scheduler()
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    async def __aenter__(self) -> 'AsyncScraper':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host)
+        return self._host_slots[host]
+
+    @staticmethod
+    def _backoff(attempt: int, response: Optional['httpx.Response'] = None) -> float:
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, HTTP_BACKOFF_MAX)
+        return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker()
+        return self._breakers[host]
+
+    async def _fetch(self, url: str) -> 'httpx.Response':
+        host = urlparse(url).netloc
+        breaker = self._breaker(host)
+        stored = self.http_store.get(url)
+        headers = self.http_store.conditional_headers(stored)
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            if not breaker.allow():
+                raise httpx.ConnectError(f"Server {host} sedang tidak dapat dihubungi, coba lagi nanti.")
+
+            await self.scheduler.acquire_async(host)
+            response = None
+            try:
+                async with self._host_slot(url):
+                    response = await self.client.get(url, headers=headers)
+            except httpx.TransportError:
+                breaker.record_failure()
+                if attempt >= HTTP_MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in HTTP_RETRY_STATUSES:
+                    breaker.record_success()
+                    self.scheduler.reward(host)
+                    return response
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                if response.status_code in SCHEDULER_THROTTLE_STATUSES:
+                    self.scheduler.penalize(host, self._backoff(attempt, response))
+                if attempt >= HTTP_MAX_RETRIES:
+                    return response
+
+            if response is None or response.status_code not in SCHEDULER_THROTTLE_STATUSES:
+                await asyncio.sleep(self._backoff(attempt, response))
+
+    async def _get_html(self, url: str) -> Optional[str]:
+        try:
+            response = await self._fetch(url)
+            if response.status_code == 304:
+                stored = self.http_store.get(url)
+                if stored:
+                    self.http_store.touch(url)
+                    return stored['body']
+            response.raise_for_status()
+            self.http_store.put(url, response)
+            return response.text
+        except httpx.HTTPError as e:
+            console.print(f"[error]Gagal mengakses {url}: {e}[/error]")
+            return None
+
+    async def _parse(self, kind: str, url: str, *args) -> Any:
+        html = await self._get_html(url)
+        if html is None: return None
+        return parsers.parse_html(kind, html, *args)
+
+    async def search_anime(self, query: str) -> Optional[List[Dict[str, str]]]:
+        return await self._parse("search_results", parsers.search_url(query))
+
+    async def get_anime_list(self, list_type: str, page: int = 1) -> Optional[Tuple[List[Dict[str, str]], bool]]:
+        html = await self._get_html(parsers.anime_list_url(list_type, page))
+        if html is None: return None, False
+        return parsers.parse_html("anime_list", html)
+
+    async def get_full_anime_list(self) -> Optional[List[Dict[str, str]]]:
+        return await self._parse("full_anime_list", parsers.full_anime_list_url())
+
+    async def get_release_schedule(self) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        return await self._parse("release_schedule", parsers.release_schedule_url())
+
+    async def get_genre_list(self) -> Optional[List[Dict[str, str]]]:
+        return await self._parse("genre_list", parsers.genre_list_url())
+
+    async def get_anime_details(self, anime_url: str) -> Optional[Dict[str, Any]]:
+        return await self._parse("anime_details", anime_url)
+
+    async def get_download_links(self, page_url: str) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        return await self._parse("download_links", page_url, page_url)
+
+    async def get_many_anime_details(self, anime_urls: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        urls = list(dict.fromkeys(anime_urls))
+        results = await asyncio.gather(*(self.get_anime_details(url) for url in urls))
+        return dict(zip(urls, results))
+
+    async def get_many_download_links(self, page_urls: Iterable[str]) -> Dict[str, Optional[Dict[str, List[Dict[str, str]]]]]:
+        urls = list(dict.fromkeys(page_urls))
+        results = await asyncio.gather(*(self.get_download_links(url) for url in urls))
+        return dict(zip(urls, results))
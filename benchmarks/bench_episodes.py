@@ -0,0 +1,115 @@
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import parsers
+from constants import BASE_URL
+
+EPISODE_COUNT = 2000
+
+def synthetic_page(episode_count: int = EPISODE_COUNT, with_sections: bool = True) -> str:
+    items = []
+    for n in range(episode_count, 0, -1):
+        items.append(f'<li><span><a href="/episode/long-runner-episode-{n}-sub-indo/">Long Runner Episode {n} Subtitle Indonesia</a></span> <span class="zeebr">01 Jan,24</span></li>')
+        if n % 100 == 0:
+            items.append(f'<li><span><a href="/episode/long-runner-episode-{n}-5-sub-indo/">Long Runner Episode {n}.5 Subtitle Indonesia</a></span></li>')
+    items.append('<li><span><a href="/episode/long-runner-ova-1-sub-indo/">Long Runner OVA 1 Subtitle Indonesia</a></span></li>')
+    items.append(f'<li><span><a href="/episode/long-runner-episode-{episode_count + 1}-ova-sub-indo/">Long Runner Episode {episode_count + 1} OVA Subtitle Indonesia</a></span></li>')
+    items.append('<li><span><a href="/episode/long-runner-episode-3-special-sub-indo/">Long Runner Episode 3 Special Subtitle Indonesia</a></span></li>')
+    episode_list = "\n".join(items)
+    batch = '<li><span><a href="/batch/long-runner-batch-sub-indo/">Long Runner Batch Subtitle Indonesia</a></span></li>'
+    if with_sections:
+        body = (
+            f'<div class="episodelist"><div class="smokelister"><span class="monktit">Long Runner Batch</span></div><ul>{batch}</ul></div>'
+            f'<div class="episodelist"><div class="smokelister"><span class="monktit">Long Runner Episode List</span></div><ul>{episode_list}</ul></div>'
+        )
+    else:
+        body = f'<ul class="oldlist">{batch}{episode_list}</ul>'
+    return (
+        '<html><head><title>Long Runner | Otaku Desu</title></head><body>'
+        '<h1 class="posttl">Long Runner Sub Indo</h1>'
+        '<div class="infozingle"><p><span><b>Status</b>: Ongoing</span></p></div>'
+        f'<div class="sinopc"><p>Sinopsis.</p></div>{body}</body></html>'
+    )
+
+def legacy_build_episodes_and_batch(sections, fallback_links):
+    episodes, batch_links = [], []
+    for title, links in sections:
+        title = title.lower()
+        if 'batch' in title:
+            for text, href in links:
+                batch_links.append({"title": text.strip(), "url": urljoin(BASE_URL, href)})
+        elif 'episode list' in title:
+            for text, href in links:
+                episodes.append({"title": text.strip(), "url": urljoin(BASE_URL, href)})
+    if not episodes and not batch_links:
+        all_links = fallback_links()
+        batch_urls = set()
+        batch_pattern = re.compile(r'batch', re.I)
+        for link_text, link_href in all_links:
+            href = urljoin(BASE_URL, link_href)
+            text = link_text.strip()
+            if batch_pattern.search(href) or batch_pattern.search(text):
+                if '/episode/' not in href or 'batch' in href:
+                    batch_links.append({"title": text, "url": href})
+                    batch_urls.add(href)
+        for link_text, link_href in all_links:
+            href = urljoin(BASE_URL, link_href)
+            if '/episode/' in href and href not in batch_urls:
+                episodes.append({"title": link_text.strip(), "url": href})
+
+    def get_episode_number(ep_title):
+        match = re.search(r'Episode\s+(\d+)', ep_title, re.IGNORECASE)
+        return int(match.group(1)) if match else 9999
+
+    unique_episodes = sorted({ep['url']: ep for ep in episodes}.values(), key=lambda x: get_episode_number(x['title']))
+    return unique_episodes, list({b['url']: b for b in batch_links}.values())
+
+def collect_links(html: str, with_sections: bool):
+    soup = parsers.make_soup(html)
+    links = [(a.text, a['href']) for a in soup.find_all('a', href=True)]
+    if not with_sections:
+        return [], lambda: links
+    sections = []
+    for container in soup.find_all('div', class_='episodelist'):
+        title_tag = container.find('span', class_='monktit')
+        sections.append((title_tag.text, [(a.text, a['href']) for a in container.find_all('a', href=True)]))
+    return sections, lambda: links
+
+def check_episodes(html: str):
+    episodes = parsers.parse_html("anime_details", html)['episodes']
+    specials = [episode for episode in episodes if parsers.SPECIAL_PATTERN.search(episode['title'])]
+    regular = [episode for episode in episodes if episode not in specials]
+    assert episodes[-len(specials):] == specials, "episode spesial harus di akhir daftar"
+    assert parsers.latest_episode_number(episodes) == parsers.latest_episode_number(regular), \
+        "episode spesial tidak boleh dihitung sebagai episode terbaru"
+
+def measure(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        parsers.absolute_url.cache_clear()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main(repeat: int = 20):
+    for with_sections in (True, False):
+        label = "episodelist" if with_sections else "fallback"
+        html = synthetic_page(with_sections=with_sections)
+        check_episodes(html)
+        sections, fallback = collect_links(html, with_sections)
+        legacy_ms = measure(lambda: legacy_build_episodes_and_batch(sections, fallback), repeat)
+        build_ms = measure(lambda: parsers.build_episodes_and_batch(sections, fallback), repeat)
+        bs4_ms = measure(lambda: parsers.parse_html("anime_details", html, backend="bs4"), max(3, repeat // 4))
+        lxml_ms = measure(lambda: parsers.parse_html("anime_details", html, backend="lxml"), max(3, repeat // 4))
+        print(f"{label:12} ekstraksi lama {legacy_ms:7.2f} ms | baru {build_ms:7.2f} ms | "
+              f"halaman penuh bs4 {bs4_ms:7.2f} ms | lxml {lxml_ms:7.2f} ms")
+
+if __name__ == "__main__":
+    main()
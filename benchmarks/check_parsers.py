@@ -0,0 +1,38 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fast_parsers
+import parsers
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+CASES = [
+    ("anime_details.html", "anime_details", ()),
+    ("anime_details_fallback.html", "anime_details", ()),
+    ("episode.html", "download_links", ("https://otakudesu.cloud/episode/bnha-s6-episode-1-sub-indo/",)),
+    ("anime_list.html", "full_anime_list", ()),
+]
+
+def timed(kind: str, html: str, args: tuple, backend: str, repeat: int = 20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = parsers.parse_html(kind, html, *args, backend=backend)
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+def main() -> int:
+    failures = 0
+    for fixture, kind, args in CASES:
+        html = (FIXTURES_DIR / fixture).read_text(encoding='utf-8')
+        expected, soup_ms = timed(kind, html, args, "bs4")
+        actual, fast_ms = timed(kind, html, args, "lxml")
+        status = "OK" if expected == actual else "BEDA"
+        failures += status != "OK"
+        print(f"{status:4} {fixture:30} {kind:16} bs4 {soup_ms:8.2f} ms | lxml {fast_ms:8.2f} ms")
+    assert set(fast_parsers.PARSERS) <= {kind for _, kind, _ in CASES}
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,430 @@
+"""Server tiruan Otakudesu untuk uji beban dan integrasi.
+
+Markup halaman mengikuti situs asli sehingga semua parser bisa dipakai apa adanya.
+Katalog dibangkitkan secara deterministik dari seed, jadi ukurannya bebas (mis. 50k judul).
+
+Contoh:
+    python benchmarks/mock_server.py --titles 50000 --latency 80 --error-rate 0.02 --rate-limit 20
+    OTAKUDESU_BASE_URL=http://127.0.0.1:8000 python main.py
+"""
+import argparse
+import base64
+import hashlib
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+PAGE_SIZE = 25
+WORDS = (
+    "Blue", "Hero", "Academia", "Sword", "Online", "Demon", "Slayer", "Attack", "Titan", "Spy",
+    "Family", "Jujutsu", "Kaisen", "Piece", "Naruto", "Mob", "Psycho", "Golden", "Kingdom", "Clover",
+    "Frontier", "Apothecary", "Monogatari", "Dragon", "Magic", "School", "Girl", "Knight", "Alchemist", "Ghost",
+)
+GENRES = (
+    "Action", "Adventure", "Comedy", "Drama", "Fantasy", "Harem", "Historical", "Horror", "Isekai", "Magic",
+    "Mecha", "Music", "Mystery", "Psychological", "Romance", "School", "Sci-Fi", "Seinen", "Shounen",
+    "Slice of Life", "Sports", "Super Power", "Supernatural", "Thriller",
+)
+DAYS = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu")
+RESOLUTIONS = ("360p", "480p", "720p", "1080p")
+HOSTS = ("ODFiles", "Pdrain", "Acefile", "GoFile", "Mega", "KFiles")
+FILE_BLOCK = bytes(range(256)) * 256
+
+def slugify(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+class Catalog:
+
+    def __init__(self, size: int, seed: int = 0):
+        self.size = size
+        self.seed = seed
+        self.titles: List[str] = []
+        self.index_by_slug: Dict[str, int] = {}
+        self._genre_index: Optional[Dict[str, List[int]]] = None
+        for i in range(size):
+            rng = random.Random(seed * 1_000_003 + i)
+            title = " ".join(rng.sample(WORDS, rng.randint(2, 4)))
+            if rng.random() < 0.3:
+                title += f" Season {rng.randint(2, 5)}"
+            title = f"{title} {i}"
+            self.titles.append(title)
+            self.index_by_slug[slugify(title)] = i
+
+    @lru_cache(maxsize=4096)
+    def entry(self, i: int) -> Dict:
+        rng = random.Random(self.seed * 1_000_003 + i + 7)
+        ongoing = i % 7 == 0
+        total = rng.randint(1, 26) if not ongoing else rng.randint(1, 12)
+        return {
+            "index": i,
+            "title": self.titles[i],
+            "slug": slugify(self.titles[i]),
+            "ongoing": ongoing,
+            "episodes": total,
+            "genres": sorted(rng.sample(GENRES, rng.randint(1, 4))),
+            "score": f"{rng.uniform(5, 9.5):.2f}",
+            "day": DAYS[(i // 7) % len(DAYS)],
+        }
+
+    def ongoing(self) -> List[int]:
+        return list(range(0, self.size, 7))
+
+    def completed(self) -> List[int]:
+        return [i for i in range(self.size) if i % 7]
+
+    def by_genre(self, genre_slug: str) -> List[int]:
+        if self._genre_index is None:
+            index: Dict[str, List[int]] = {}
+            for i in range(self.size):
+                for genre in self.entry(i)["genres"]:
+                    index.setdefault(slugify(genre), []).append(i)
+            self._genre_index = index
+        return self._genre_index.get(genre_slug, [])
+
+    def search(self, query: str, limit: int = 50) -> List[int]:
+        query = query.lower()
+        return [i for i, title in enumerate(self.titles) if query in title.lower()][:limit]
+
+class Faults:
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0,
+                 rate_limit: float = 0, abort_rate: float = 0, bandwidth: float = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.abort_rate = abort_rate
+        self.bandwidth = bandwidth
+        self._lock = threading.Lock()
+        self._tokens = rate_limit
+        self._updated = time.monotonic()
+
+    def delay(self):
+        latency = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if latency > 0:
+            time.sleep(latency / 1000)
+
+    def rate_limited(self) -> bool:
+        if self.rate_limit <= 0: return False
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate_limit, self._tokens + (now - self._updated) * self.rate_limit)
+            self._updated = now
+            if self._tokens < 1:
+                return True
+            self._tokens -= 1
+            return False
+
+    def failed(self) -> bool:
+        return random.random() < self.error_rate
+
+    def aborted(self) -> bool:
+        return random.random() < self.abort_rate
+
+class SiteRenderer:
+
+    def __init__(self, catalog: Catalog, base_url: str):
+        self.catalog = catalog
+        self.base_url = base_url
+
+    def anime_url(self, i: int) -> str:
+        return f"{self.base_url}/anime/{self.catalog.entry(i)['slug']}-sub-indo/"
+
+    def page(self, title: str, body: str) -> str:
+        return (f'<!DOCTYPE html>\n<html lang="id"><head><meta charset="UTF-8"><title>{escape(title)} | Otaku Desu</title></head>\n'
+                f'<body><div id="venkonten"><div class="venser"><div class="venutama">\n{body}\n</div></div></div></body></html>\n')
+
+    def search(self, query: str) -> str:
+        items = []
+        for i in self.catalog.search(query):
+            entry = self.catalog.entry(i)
+            genres = ", ".join(f'<a href="{self.base_url}/genres/{slugify(g)}/" rel="tag">{g}</a>' for g in entry["genres"])
+            items.append(
+                f'<li style="list-style:none;"><h2><a href="{self.anime_url(i)}">{escape(entry["title"])} Subtitle Indonesia</a></h2>'
+                f'<div class="set"><b>Genres</b> : {genres}</div>'
+                f'<div class="set"><b>Status</b> : {"Ongoing" if entry["ongoing"] else "Completed"}</div></li>'
+            )
+        return self.page(f'Search Results for "{query}"', '<ul class="chivsrc">\n' + "\n".join(items) + '\n</ul>')
+
+    def listing(self, path: str, indices: List[int], page: int) -> Optional[str]:
+        last_page = max(1, -(-len(indices) // PAGE_SIZE))
+        if page > last_page: return None
+        items = []
+        for i in indices[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]:
+            entry = self.catalog.entry(i)
+            items.append(
+                f'<li><div class="detpost"><div class="epz"><i class="fa fa-play"></i> Episode {entry["episodes"]}</div>'
+                f'<div class="epztipe"><i class="fa fa-calendar"></i> {entry["day"]}</div>'
+                f'<div class="thumb"><a href="{self.anime_url(i)}"><div class="thumbz"><h2 class="jdlflm">{escape(entry["title"])}</h2></div></a></div></div></li>'
+            )
+        pages = sorted({1, page - 1, page, page + 1, last_page} & set(range(1, last_page + 1)))
+        links = [
+            f'<span aria-current="page" class="page-numbers current">{n}</span>' if n == page
+            else f'<a class="page-numbers" href="{self.base_url}/{path}/page/{n}/">{n}</a>'
+            for n in pages
+        ]
+        if page < last_page:
+            links.append(f'<a class="next page-numbers" href="{self.base_url}/{path}/page/{page + 1}/">Berikutnya &raquo;</a>')
+        body = ('<div class="venz"><ul>\n' + "\n".join(items) + '\n</ul></div>\n'
+                f'<div class="pagination"><div class="pagenavix">{"".join(links)}</div></div>')
+        return self.page(path, body)
+
+    def full_list(self) -> str:
+        groups: Dict[str, List[int]] = {}
+        for i, title in enumerate(self.catalog.titles):
+            letter = title[0].upper() if title[0].isalpha() else "#"
+            groups.setdefault(letter, []).append(i)
+        columns = []
+        for letter in sorted(groups):
+            links = "".join(
+                f'<li><a class="hodebgst" href="{self.anime_url(i)}">{escape(self.catalog.titles[i])}</a></li>\n'
+                for i in groups[letter]
+            )
+            columns.append(f'<div class="bariskelom"><div class="barispenz"><a name="{letter}">{letter}</a></div>'
+                           f'<div class="penzbar"><div class="jdlbar"><ul>\n{links}</ul></div></div></div>')
+        return self.page("Anime List", '<div class="daftarkartun"><div id="abtext">\n' + "\n".join(columns) + '\n</div></div>')
+
+    def schedule(self) -> str:
+        days = []
+        for offset, day in enumerate(DAYS):
+            items = "".join(
+                f'<li><a href="{self.anime_url(i)}">{escape(self.catalog.titles[i])}</a></li>\n'
+                for i in self.catalog.ongoing() if (i // 7) % len(DAYS) == offset
+            )
+            days.append(f'<div class="kglist321"><h2>{day}</h2><ul>\n{items}</ul><div class="clear"></div></div>')
+        return self.page("Jadwal Rilis", '<div class="kgjdwl321">\n' + "\n".join(days) + '\n</div>')
+
+    def genre_list(self) -> str:
+        links = "".join(f'<a href="/genres/{slugify(g)}/" title="View all anime in {g}">{g}</a><br>\n' for g in GENRES)
+        return self.page("Genre List", f'<div class="genrelist"><ul class="genres"><li>\n{links}</li></ul></div>')
+
+    def details(self, i: int) -> str:
+        entry = self.catalog.entry(i)
+        slug = entry["slug"]
+        genres = ", ".join(f'<a href="{self.base_url}/genres/{slugify(g)}/" rel="tag">{g}</a>' for g in entry["genres"])
+        info = [
+            ("Judul", escape(entry["title"])),
+            ("Skor", entry["score"]),
+            ("Tipe", "TV"),
+            ("Status", "Ongoing" if entry["ongoing"] else "Completed"),
+            ("Total Episode", "Unknown" if entry["ongoing"] else str(entry["episodes"])),
+            ("Studio", "Mock Studio"),
+            ("Genre", genres),
+        ]
+        info_html = "\n".join(f'<p><span><b>{key}</b>: {value}</span></p>' for key, value in info)
+        episodes = "\n".join(
+            f'<li><span><a href="{self.base_url}/episode/{slug}-episode-{n}-sub-indo/">{escape(entry["title"])} Episode {n} Subtitle Indonesia</a></span></li>'
+            for n in range(entry["episodes"], 0, -1)
+        )
+        batch = "" if entry["ongoing"] else (
+            '<div class="episodelist"><div class="smokelister"><span class="monktit">'
+            f'{escape(entry["title"])} Batch Sub Indo</span></div><ul>\n'
+            f'<li><span><a href="{self.base_url}/batch/{slug}-batch-sub-indo/">{escape(entry["title"])} Batch Subtitle Indonesia</a></span></li>\n</ul></div>'
+        )
+        body = (f'<h1 class="posttl">{escape(entry["title"])} Subtitle Indonesia</h1>\n'
+                f'<div class="fotoanime"><div class="infozingle">\n{info_html}\n</div></div>\n'
+                f'<div class="sinopc"><p>{escape(entry["title"])} adalah anime tiruan untuk pengujian.</p></div>\n'
+                f'{batch}\n'
+                '<div class="episodelist"><div class="smokelister"><span class="monktit">'
+                f'{escape(entry["title"])} Episode List</span></div><ul>\n{episodes}\n</ul></div>')
+        return self.page(entry["title"], body)
+
+    def downloads(self, i: int, label: str, file_stem: str) -> str:
+        entry = self.catalog.entry(i)
+        rows = []
+        for resolution in RESOLUTIONS:
+            anchors = " ".join(
+                f'<a href="#" data-content="{self.encode(f"{self.base_url}/files/{host.lower()}/{file_stem}-{resolution}.mp4")}">{host}</a>'
+                for host in HOSTS
+            )
+            rows.append(f'<li><strong>Mp4 {resolution}</strong> {anchors}</li>')
+        return self.page(f'{entry["title"]} {label}',
+                         f'<div class="download"><h4>Download {escape(entry["title"])} {label} Subtitle Indonesia</h4>'
+                         '<ul>\n' + "\n".join(rows) + '\n</ul></div>')
+
+    @staticmethod
+    def encode(url: str) -> str:
+        return base64.b64encode(url.encode()).decode().rstrip('=')
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    renderer: SiteRenderer
+    faults: Faults
+    file_size: int
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def do_HEAD(self):
+        self.do_GET(head=True)
+
+    def do_GET(self, head: bool = False):
+        self.faults.delay()
+        if self.faults.rate_limited():
+            return self.send_body(429, b"Too Many Requests", extra={"Retry-After": "1"}, head=head)
+        if self.faults.failed():
+            return self.send_body(random.choice((500, 502, 503)), b"Server Error", head=head)
+
+        parsed = urlparse(self.path)
+        path = unquote(parsed.path)
+        if path.startswith("/files/"):
+            return self.send_file(head)
+
+        html = self.route(path, parse_qs(parsed.query))
+        if html is None:
+            return self.send_body(404, b"Not Found", head=head)
+        body = html.encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            return self.send_body(304, b"", extra={"ETag": etag}, head=True)
+        self.send_body(200, body, content_type="text/html; charset=UTF-8", extra={"ETag": etag}, head=head)
+
+    def route(self, path: str, query: Dict[str, List[str]]) -> Optional[str]:
+        renderer, catalog = self.renderer, self.renderer.catalog
+        if path == "/" and "s" in query:
+            return renderer.search(query["s"][0])
+        match = re.fullmatch(r'/(ongoing-anime|complete-anime)(?:/page/(\d+))?/?', path)
+        if match:
+            indices = catalog.ongoing() if match.group(1) == "ongoing-anime" else catalog.completed()
+            return renderer.listing(match.group(1), indices, int(match.group(2) or 1))
+        match = re.fullmatch(r'/genres/([^/]+)(?:/page/(\d+))?/?', path)
+        if match:
+            return renderer.listing(f"genres/{match.group(1)}", catalog.by_genre(match.group(1)), int(match.group(2) or 1))
+        if path == "/anime-list/":
+            return renderer.full_list()
+        if path == "/jadwal-rilis/":
+            return renderer.schedule()
+        if path == "/genre-list/":
+            return renderer.genre_list()
+        match = re.fullmatch(r'/anime/(.+)-sub-indo/?', path)
+        if match and match.group(1) in catalog.index_by_slug:
+            return renderer.details(catalog.index_by_slug[match.group(1)])
+        match = re.fullmatch(r'/episode/(.+)-episode-(\d+)-sub-indo/?', path)
+        if match and match.group(1) in catalog.index_by_slug:
+            i, number = catalog.index_by_slug[match.group(1)], int(match.group(2))
+            if 1 <= number <= catalog.entry(i)["episodes"]:
+                return renderer.downloads(i, f"Episode {number}", f"{match.group(1)}-episode-{number}")
+        match = re.fullmatch(r'/batch/(.+)-batch-sub-indo/?', path)
+        if match and match.group(1) in catalog.index_by_slug:
+            return renderer.downloads(catalog.index_by_slug[match.group(1)], "Batch", f"{match.group(1)}-batch")
+        return None
+
+    def send_body(self, status: int, body: bytes, content_type: str = "text/plain",
+                  extra: Optional[Dict[str, str]] = None, head: bool = False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def send_file(self, head: bool):
+        start, end = 0, self.file_size - 1
+        match = re.fullmatch(r'bytes=(\d*)-(\d*)', self.headers.get("Range", ""))
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                end = min(int(match.group(2)), end) if match.group(2) else end
+            else:
+                start = max(0, self.file_size - int(match.group(2)))
+            if start > end:
+                return self.send_body(416, b"", extra={"Content-Range": f"bytes */{self.file_size}"}, head=True)
+        status = 206 if match else 200
+
+        self.send_response(status)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("ETag", f'"mock-{self.file_size}"')
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{self.file_size}")
+        self.end_headers()
+        if head: return
+
+        abort_at = random.randint(start, end) if self.faults.aborted() else None
+        position = start
+        try:
+            while position <= end:
+                offset = position % len(FILE_BLOCK)
+                chunk = FILE_BLOCK[offset:offset + min(end - position + 1, len(FILE_BLOCK) - offset)]
+                if abort_at is not None and position + len(chunk) > abort_at:
+                    self.wfile.write(chunk[:abort_at - position])
+                    self.close_connection = True
+                    return
+                self.wfile.write(chunk)
+                position += len(chunk)
+                if self.faults.bandwidth > 0:
+                    time.sleep(len(chunk) / self.faults.bandwidth)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+def expected_file_bytes(size: int) -> bytes:
+    return (FILE_BLOCK * (size // len(FILE_BLOCK) + 1))[:size]
+
+class MockServer:
+
+    def __init__(self, titles: int = 1000, host: str = "127.0.0.1", port: int = 0, seed: int = 0,
+                 file_size: int = 8 * 1024 * 1024, faults: Optional[Faults] = None):
+        self.catalog = Catalog(titles, seed)
+        self.faults = faults or Faults()
+        handler = type("Handler", (MockHandler,), {"faults": self.faults, "file_size": file_size})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        handler.renderer = SiteRenderer(self.catalog, self.base_url)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> 'MockServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Server tiruan Otakudesu untuk pengujian lokal.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--titles", type=int, default=1000, help="Jumlah judul dalam katalog.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0, help="Latensi tambahan per permintaan (ms).")
+    parser.add_argument("--jitter", type=float, default=0, help="Variasi latensi (ms).")
+    parser.add_argument("--error-rate", type=float, default=0, help="Peluang respons 5xx (0-1).")
+    parser.add_argument("--rate-limit", type=float, default=0, help="Permintaan per detik sebelum 429 (0 = tanpa batas).")
+    parser.add_argument("--abort-rate", type=float, default=0, help="Peluang unduhan file terputus di tengah (0-1).")
+    parser.add_argument("--file-size", type=int, default=8, help="Ukuran file unduhan tiruan (MB).")
+    parser.add_argument("--bandwidth", type=float, default=0, help="Batas kecepatan per koneksi unduhan (KB/s, 0 = tanpa batas).")
+    args = parser.parse_args()
+
+    faults = Faults(args.latency, args.jitter, args.error_rate, args.rate_limit, args.abort_rate, args.bandwidth * 1024)
+    server = MockServer(args.titles, args.host, args.port, args.seed, args.file_size * 1024 * 1024, faults)
+    print(f"Server tiruan berjalan di {server.base_url} ({args.titles} judul). Tekan Ctrl+C untuk berhenti.")
+    print(f"Gunakan: OTAKUDESU_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Harness benchmark: parser Scraper terhadap fixture lokal dan CacheManager.
+
+Contoh:
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mock_server import MockServer
+from stub_server import StubServer
+
+CACHE_SIZES = (1_000, 10_000, 100_000)
+REGRESSION_THRESHOLD = 1.10
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def measure(name: str, func: Callable[[], Any], iterations: int, items_per_call: int = 1) -> Dict[str, Any]:
+    func()
+    samples = []
+    tracemalloc.start()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    total = sum(samples)
+    return {
+        "name": name,
+        "iterations": iterations,
+        "throughput_per_s": round(iterations * items_per_call / total, 2) if total else None,
+        "p50_ms": round(percentile(samples, 50) * 1000, 4),
+        "p99_ms": round(percentile(samples, 99) * 1000, 4),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+def bench_scraper(iterations: int) -> List[Dict[str, Any]]:
+    from rate_limiter import HostScheduler
+    from result_cache import ResultCache
+    from scraper import Scraper
+    from transport import Transport
+
+    unlimited = HostScheduler(default_rate=1e9, default_burst=1e9, limits={})
+    scraper = Scraper(transport=Transport(max_retries=0, scheduler=unlimited), results=ResultCache(ttl=0))
+    base = os.environ["OTAKUDESU_BASE_URL"]
+    anime_url = base + urlparse(scraper.get_anime_list("ongoing-anime", 1)[0][0]["url"]).path
+    episode_url = base + urlparse(scraper.get_anime_details(anime_url)["episodes"][0]["url"]).path
+    cases = [
+        ("scraper.search_anime", lambda: scraper.search_anime("hero")),
+        ("scraper.get_anime_list", lambda: scraper.get_anime_list("ongoing-anime", 1)),
+        ("scraper.get_anime_details", lambda: scraper.get_anime_details(anime_url)),
+        ("scraper.get_download_links", lambda: scraper.get_download_links(episode_url)),
+        ("scraper.get_release_schedule", scraper.get_release_schedule),
+        ("scraper.get_genre_list", scraper.get_genre_list),
+        ("scraper.get_full_anime_list", scraper.get_full_anime_list),
+    ]
+    results = []
+    for name, func in cases:
+        if not func():
+            raise RuntimeError(f"{name} tidak mengembalikan data dari server lokal")
+        results.append(measure(name, func, iterations))
+    return results
+
+def sample_details(i: int) -> Dict[str, Any]:
+    return {
+        "title": f"Anime {i} Sub Indo",
+        "judul": f"Anime {i}",
+        "status": "Completed" if i % 3 else "Ongoing",
+        "genre": "Action, Comedy, Fantasy",
+        "sinopsis": "Lorem ipsum dolor sit amet. " * 20,
+        "episodes": [{"title": f"Anime {i} Episode {n}", "url": f"https://example/episode/{i}-{n}/"} for n in range(1, 13)],
+        "batch_links": [],
+    }
+
+def bench_cache(sizes: List[int]) -> List[Dict[str, Any]]:
+    import cache_manager
+    from cache_manager import CacheManager
+    from constants import CACHE_DB_FILE
+
+    cache_manager.DETAILS_CACHE_MAX_ENTRIES = max(sizes) * 2
+    cache_manager.DETAILS_CACHE_MAX_BYTES = 1 << 40
+    results = []
+    for size in sizes:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{CACHE_DB_FILE}{suffix}").unlink(missing_ok=True)
+        cache = CacheManager()
+        payloads = [(f"https://example/anime/{i}/", sample_details(i)) for i in range(size)]
+
+        def save_all():
+            for url, details in payloads:
+                cache.set_anime_details(url, details)
+
+        save = measure(f"cache.save.{size}", save_all, 1, items_per_call=size)
+        save_samples = []
+        for url, details in random.sample(payloads, min(size, 1000)):
+            start = time.perf_counter()
+            cache.set_anime_details(url, details)
+            save_samples.append(time.perf_counter() - start)
+        save["p50_ms"] = round(percentile(save_samples, 50) * 1000, 4)
+        save["p99_ms"] = round(percentile(save_samples, 99) * 1000, 4)
+        cache.close()
+        results.append(save)
+
+        results.append(measure(f"cache.load.{size}", lambda: CacheManager().close(), 5))
+
+        cache = CacheManager()
+        urls = [url for url, _ in payloads]
+        lookup_samples = []
+        for url in random.sample(urls, min(size, 1000)):
+            start = time.perf_counter()
+            cache.get_anime_details(url)
+            lookup_samples.append(time.perf_counter() - start)
+        results.append({
+            "name": f"cache.get_anime_details.{size}",
+            "iterations": len(lookup_samples),
+            "throughput_per_s": round(len(lookup_samples) / sum(lookup_samples), 2),
+            "p50_ms": round(percentile(lookup_samples, 50) * 1000, 4),
+            "p99_ms": round(percentile(lookup_samples, 99) * 1000, 4),
+            "mean_ms": round(statistics.fmean(lookup_samples) * 1000, 4),
+            "peak_memory_kb": None,
+        })
+        results.append(measure(f"cache.get_all_cached_details.{size}", cache.get_all_cached_details, 3, items_per_call=size))
+        cache.close()
+    return results
+
+def compare(current: Dict[str, Any], baseline_path: Path) -> int:
+    baseline = {r["name"]: r for r in json.loads(baseline_path.read_text(encoding="utf-8"))["results"]}
+    regressions = 0
+    for result in current["results"]:
+        old = baseline.get(result["name"])
+        if not old or not old.get("p50_ms"):
+            continue
+        ratio = result["p50_ms"] / old["p50_ms"]
+        flag = "LAMBAT" if ratio > REGRESSION_THRESHOLD else ""
+        regressions += bool(flag)
+        print(f"{result['name']:40} p50 {old['p50_ms']:10.3f} -> {result['p50_ms']:10.3f} ms  x{ratio:5.2f} {flag}", file=sys.stderr)
+    return 1 if regressions else 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark scraper dan cache Otakudesu.")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--cache-sizes", type=int, nargs="*", default=list(CACHE_SIZES))
+    parser.add_argument("--skip-cache", action="store_true")
+    parser.add_argument("--catalog", type=int, help="Gunakan server tiruan dengan katalog sebanyak N judul, bukan fixture rekaman.")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    args = parser.parse_args(argv)
+
+    server_factory = (lambda: MockServer(titles=args.catalog)) if args.catalog else StubServer
+    with tempfile.TemporaryDirectory() as data_dir, server_factory() as server:
+        os.environ["OTAKUDESU_BASE_URL"] = server.base_url
+        os.environ["OTAKUDESU_DATA_DIR"] = data_dir
+        from constants import PARSER_BACKEND
+
+        results = bench_scraper(args.iterations)
+        if not args.skip_cache:
+            results.extend(bench_cache(args.cache_sizes))
+
+    report = {
+        "meta": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parser_backend": PARSER_BACKEND,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    else:
+        print(output)
+    return compare(report, args.compare) if args.compare else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
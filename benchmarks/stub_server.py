@@ -0,0 +1,66 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+ROUTES: Tuple[Tuple[str, str], ...] = (
+    ("/anime-list/", "anime_list.html"),
+    ("/jadwal-rilis/", "schedule.html"),
+    ("/genre-list/", "genre_list.html"),
+    ("/ongoing-anime/", "ongoing.html"),
+    ("/complete-anime/", "ongoing.html"),
+    ("/genres/", "ongoing.html"),
+    ("/anime/", "anime_details.html"),
+    ("/episode/", "episode.html"),
+    ("/batch/", "episode.html"),
+)
+
+def load_fixtures() -> Dict[str, bytes]:
+    return {path.name: path.read_bytes() for path in FIXTURES_DIR.glob("*.html")}
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    fixtures: Dict[str, bytes] = {}
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == "/" and parsed.query.startswith("s="):
+            name = "search.html"
+        else:
+            name = next((fixture for prefix, fixture in ROUTES if parsed.path.startswith(prefix)), None)
+        body = self.fixtures.get(name) if name else None
+        if body is None:
+            self.send_response(404 if parsed.path != "/" else 200)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class StubServer:
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        handler = type("Handler", (FixtureHandler,), {"fixtures": load_fixtures()})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> 'StubServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -1,126 +1,476 @@
 import json
+import sqlite3
+import threading
 import time
 from typing import Any, Dict, List, Optional
 
-from constants import (CACHE_FILE, DEFAULT_CACHE,
+from constants import (CACHE_FILE, CACHE_DB_FILE, DEFAULT_CACHE,
+                                     DETAILS_TTL_ONGOING, DETAILS_TTL_COMPLETED,
+                                     DETAILS_CACHE_MAX_ENTRIES, DETAILS_CACHE_MAX_BYTES,
+                                     FULL_ANIME_LIST_TTL, DOWNLOAD_LINKS_TTL,
                                      CACHE_KEY_FAVORITES,
                                      CACHE_KEY_ANIME_DETAILS,
                                      CACHE_KEY_SEARCH_HISTORY,
                                      CACHE_KEY_WATCHED_EPISODES,
                                      CACHE_KEY_LAST_EPISODE_CHECK,
-                                     CACHE_KEY_FULL_ANIME_LIST)
-from utils import show_message
+                                     CACHE_KEY_FULL_ANIME_LIST,
+                                     CACHE_KEY_DOWNLOAD_QUEUE,
+                                     CACHE_KEY_DOWNLOAD_LINKS,
+                                     CACHE_KEY_HOST_STATS)
+from utils import group_anime_by_letter, show_message
+
+SEARCH_HISTORY_LIMIT = 50
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_FAVORITES} (
+    url TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_{CACHE_KEY_FAVORITES}_position ON {CACHE_KEY_FAVORITES} (position);
+
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_ANIME_DETAILS} (
+    url TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_SEARCH_HISTORY} (
+    query TEXT PRIMARY KEY,
+    timestamp REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_{CACHE_KEY_SEARCH_HISTORY}_timestamp ON {CACHE_KEY_SEARCH_HISTORY} (timestamp);
+
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_WATCHED_EPISODES} (
+    url TEXT PRIMARY KEY,
+    timestamp REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_LAST_EPISODE_CHECK} (
+    url TEXT PRIMARY KEY,
+    episode_count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_FULL_ANIME_LIST} (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_DOWNLOAD_LINKS} (
+    url TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_HOST_STATS} (
+    host TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS {CACHE_KEY_DOWNLOAD_QUEUE} (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+DETAILS_COLUMNS = {
+    "fetched_at": "REAL NOT NULL DEFAULT 0",
+    "accessed_at": "REAL NOT NULL DEFAULT 0",
+    "expires_at": "REAL NOT NULL DEFAULT 0",
+    "size_bytes": "INTEGER NOT NULL DEFAULT 0",
+}
+
+def is_completed(details: Dict[str, Any]) -> bool:
+    status = str(details.get('status', '')).lower()
+    return 'completed' in status or 'tamat' in status
+
+def details_ttl(details: Dict[str, Any]) -> float:
+    return DETAILS_TTL_COMPLETED if is_completed(details) else DETAILS_TTL_ONGOING
 
 class CacheManager:
 
     def __init__(self):
-        self._cache: Dict[str, Any] = self._load()
+        self._lock = threading.RLock()
+        self.revision = 0
+        self.full_list_revision = 0
+        self._details_reset_revision = 0
+        self._details_log: Dict[str, int] = {}
+        self._details_size: Optional[List[int]] = None
+        self._conn = sqlite3.connect(CACHE_DB_FILE, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._upgrade_details_table()
+        self._migrate_from_json()
 
-    def _load(self) -> Dict[str, Any]:
-        if not CACHE_FILE.exists():
-            return DEFAULT_CACHE.copy()
+    def _upgrade_details_table(self):
+        existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({CACHE_KEY_ANIME_DETAILS})")}
+        with self._conn:
+            for column, definition in DETAILS_COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE {CACHE_KEY_ANIME_DETAILS} ADD COLUMN {column} {definition}")
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{CACHE_KEY_ANIME_DETAILS}_accessed_at "
+                f"ON {CACHE_KEY_ANIME_DETAILS} (accessed_at)"
+            )
+
+    def _load_json(self) -> Optional[Dict[str, Any]]:
         try:
             with open(CACHE_FILE, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-
-            for key, default_value in DEFAULT_CACHE.items():
-                if key not in data:
-                    data[key] = default_value
-
-            favs = data.get(CACHE_KEY_FAVORITES)
-            if isinstance(favs, dict):
-                data[CACHE_KEY_FAVORITES] = list(favs.values())
-            elif not isinstance(favs, list):
-                data[CACHE_KEY_FAVORITES] = []
-            
-            return data
-            
         except (json.JSONDecodeError, IOError):
             show_message(
                 f"File cache di {CACHE_FILE} rusak atau tidak dapat dibaca. Memulai dengan cache baru.",
                 "Peringatan Cache", "warning"
             )
-            return DEFAULT_CACHE.copy()
+            return None
+
+        for key, default_value in DEFAULT_CACHE.items():
+            if key not in data:
+                data[key] = default_value
+
+        favs = data.get(CACHE_KEY_FAVORITES)
+        if isinstance(favs, dict):
+            data[CACHE_KEY_FAVORITES] = list(favs.values())
+        elif not isinstance(favs, list):
+            data[CACHE_KEY_FAVORITES] = []
+        return data
+
+    def _migrate_from_json(self):
+        if not CACHE_FILE.exists():
+            return
+        data = self._load_json()
+        if data is not None:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    f"INSERT OR IGNORE INTO {CACHE_KEY_FAVORITES} (url, position, data) VALUES (?, ?, ?)",
+                    [(fav['url'], i, json.dumps(fav, ensure_ascii=False))
+                     for i, fav in enumerate(data[CACHE_KEY_FAVORITES]) if isinstance(fav, dict) and 'url' in fav]
+                )
+                now = time.time()
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {CACHE_KEY_ANIME_DETAILS} "
+                    f"(url, data, fetched_at, accessed_at, expires_at, size_bytes) VALUES (?, ?, ?, ?, ?, ?)",
+                    [self._details_row(url, details, now) for url, details in data[CACHE_KEY_ANIME_DETAILS].items()]
+                )
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {CACHE_KEY_SEARCH_HISTORY} (query, timestamp) VALUES (?, ?)",
+                    [(item['query'], item.get('timestamp', 0)) for item in data[CACHE_KEY_SEARCH_HISTORY] if 'query' in item]
+                )
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {CACHE_KEY_WATCHED_EPISODES} (url, timestamp) VALUES (?, ?)",
+                    list(data[CACHE_KEY_WATCHED_EPISODES].items())
+                )
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {CACHE_KEY_LAST_EPISODE_CHECK} (url, episode_count) VALUES (?, ?)",
+                    list(data[CACHE_KEY_LAST_EPISODE_CHECK].items())
+                )
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {CACHE_KEY_FULL_ANIME_LIST} (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(value, ensure_ascii=False)) for key, value in data[CACHE_KEY_FULL_ANIME_LIST].items()]
+                )
+        try:
+            CACHE_FILE.replace(CACHE_FILE.with_suffix('.json.migrated'))
+        except OSError:
+            show_message(
+                f"Gagal memindahkan {CACHE_FILE} setelah migrasi. Periksa izin file.",
+                "Peringatan Cache", "warning"
+            )
+
+    def _execute(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Cursor]:
+        try:
+            with self._lock, self._conn:
+                return self._conn.execute(sql, params)
+        except sqlite3.Error:
+            show_message(
+                f"Gagal menyimpan cache ke {CACHE_DB_FILE}. Periksa izin file.",
+                "Error Cache", "error"
+            )
+            return None
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
 
     def save(self):
         try:
-            with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self._cache, f, ensure_ascii=False, indent=2)
-        except IOError:
+            with self._lock:
+                self._conn.commit()
+        except sqlite3.Error:
             show_message(
-                f"Gagal menyimpan cache ke {CACHE_FILE}. Periksa izin file.",
+                f"Gagal menyimpan cache ke {CACHE_DB_FILE}. Periksa izin file.",
                 "Error Cache", "error"
             )
 
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _details_row(url: str, details: Dict[str, Any], now: float) -> tuple:
+        data = json.dumps(details, ensure_ascii=False)
+        return (url, data, now, now, now + details_ttl(details), len(data.encode('utf-8')))
+
     def get_anime_details(self, url: str) -> Optional[Dict[str, Any]]:
-        return self._cache[CACHE_KEY_ANIME_DETAILS].get(url)
+        rows = self._query(f"SELECT data FROM {CACHE_KEY_ANIME_DETAILS} WHERE url = ?", (url,))
+        if not rows:
+            return None
+        self._execute(f"UPDATE {CACHE_KEY_ANIME_DETAILS} SET accessed_at = ? WHERE url = ?", (time.time(), url))
+        return json.loads(rows[0][0])
+
+    def is_anime_details_stale(self, url: str) -> bool:
+        rows = self._query(f"SELECT expires_at FROM {CACHE_KEY_ANIME_DETAILS} WHERE url = ?", (url,))
+        return not rows or rows[0][0] <= time.time()
+
+    def _details_totals(self) -> List[int]:
+        if self._details_size is None:
+            self._details_size = list(self._query(
+                f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM {CACHE_KEY_ANIME_DETAILS}"
+            )[0])
+        return self._details_size
 
     def set_anime_details(self, url: str, details: Dict[str, Any]):
-        self._cache[CACHE_KEY_ANIME_DETAILS][url] = details
-        self.save()
+        row = self._details_row(url, details, time.time())
+        with self._lock:
+            totals = self._details_totals()
+            previous = self._query(f"SELECT size_bytes FROM {CACHE_KEY_ANIME_DETAILS} WHERE url = ?", (url,))
+            if self._execute(
+                f"INSERT OR REPLACE INTO {CACHE_KEY_ANIME_DETAILS} "
+                f"(url, data, fetched_at, accessed_at, expires_at, size_bytes) VALUES (?, ?, ?, ?, ?, ?)",
+                row
+            ) is None:
+                return
+            if previous:
+                totals[1] -= previous[0][0]
+            else:
+                totals[0] += 1
+            totals[1] += row[-1]
+            self.revision += 1
+            self._details_log[url] = self.revision
+            self._evict_anime_details()
+
+    def _evict_anime_details(self):
+        totals = self._details_totals()
+        if totals[0] <= DETAILS_CACHE_MAX_ENTRIES and totals[1] <= DETAILS_CACHE_MAX_BYTES:
+            return
+
+        count, total_bytes = totals
+        while count > DETAILS_CACHE_MAX_ENTRIES or total_bytes > DETAILS_CACHE_MAX_BYTES:
+            evicted = []
+            rows = self._query(
+                f"SELECT url, size_bytes FROM {CACHE_KEY_ANIME_DETAILS} ORDER BY accessed_at LIMIT ?",
+                (max(1, count - DETAILS_CACHE_MAX_ENTRIES) + 100,)
+            )
+            if not rows:
+                count, total_bytes = 0, 0
+                break
+            for url, size_bytes in rows:
+                if count <= DETAILS_CACHE_MAX_ENTRIES and total_bytes <= DETAILS_CACHE_MAX_BYTES:
+                    break
+                evicted.append((url,))
+                count -= 1
+                total_bytes -= size_bytes
+            with self._lock, self._conn:
+                self._conn.executemany(f"DELETE FROM {CACHE_KEY_ANIME_DETAILS} WHERE url = ?", evicted)
+        self._details_size = [count, total_bytes]
 
     def get_all_cached_details(self) -> Dict[str, Any]:
-        return self._cache[CACHE_KEY_ANIME_DETAILS]
+        rows = self._query(f"SELECT url, data FROM {CACHE_KEY_ANIME_DETAILS}")
+        return {url: json.loads(data) for url, data in rows}
+
+    def get_many_cached_details(self, urls: List[str]) -> Dict[str, Any]:
+        found = {}
+        for start in range(0, len(urls), 500):
+            batch = urls[start:start + 500]
+            rows = self._query(
+                f"SELECT url, data FROM {CACHE_KEY_ANIME_DETAILS} WHERE url IN ({', '.join('?' * len(batch))})", tuple(batch)
+            )
+            found.update((url, json.loads(data)) for url, data in rows)
+        return found
+
+    def details_changed_since(self, revision: int) -> Optional[List[str]]:
+        with self._lock:
+            if revision < self._details_reset_revision:
+                return None
+            return [url for url, changed_at in self._details_log.items() if changed_at > revision]
+
+    def get_full_anime_list(self) -> Optional[Dict[str, Any]]:
+        rows = dict(self._query(
+            f"SELECT key, value FROM {CACHE_KEY_FULL_ANIME_LIST} WHERE key IN ('grouped', 'timestamp')"
+        ))
+        if 'grouped' not in rows:
+            return None
+        return {"grouped": json.loads(rows['grouped']), "timestamp": json.loads(rows.get('timestamp', '0'))}
+
+    def is_full_anime_list_stale(self) -> bool:
+        rows = self._query(f"SELECT value FROM {CACHE_KEY_FULL_ANIME_LIST} WHERE key = 'timestamp'")
+        return not rows or json.loads(rows[0][0]) + FULL_ANIME_LIST_TTL <= time.time()
+
+    def set_full_anime_list(self, anime_list: List[Dict[str, str]]) -> Dict[str, List[Dict[str, str]]]:
+        grouped = group_anime_by_letter(anime_list)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {CACHE_KEY_FULL_ANIME_LIST} (key, value) VALUES (?, ?)",
+                [("grouped", json.dumps(grouped, ensure_ascii=False)), ("timestamp", json.dumps(time.time()))]
+            )
+            self.revision += 1
+            self.full_list_revision = self.revision
+        return grouped
 
     def get_favorites(self) -> List[Dict[str, Any]]:
-        return self._cache[CACHE_KEY_FAVORITES]
+        rows = self._query(f"SELECT data FROM {CACHE_KEY_FAVORITES} ORDER BY position")
+        return [json.loads(data) for (data,) in rows]
 
     def add_to_favorites(self, anime: Dict[str, Any]) -> bool:
-        if not any(fav['url'] == anime['url'] for fav in self.get_favorites()):
-            self._cache[CACHE_KEY_FAVORITES].append(anime)
-            self.save()
-            return True
-        return False
+        cursor = self._execute(
+            f"INSERT OR IGNORE INTO {CACHE_KEY_FAVORITES} (url, position, data) "
+            f"SELECT ?, COALESCE(MAX(position), -1) + 1, ? FROM {CACHE_KEY_FAVORITES}",
+            (anime['url'], json.dumps(anime, ensure_ascii=False))
+        )
+        return cursor is not None and cursor.rowcount == 1
 
     def remove_from_favorites(self, index: int) -> Optional[Dict[str, Any]]:
-        if 0 <= index < len(self.get_favorites()):
-            removed = self._cache[CACHE_KEY_FAVORITES].pop(index)
-            self.save()
-            return removed
-        return None
+        if index < 0:
+            return None
+        with self._lock:
+            rows = self._query(
+                f"SELECT url, data FROM {CACHE_KEY_FAVORITES} ORDER BY position LIMIT 1 OFFSET ?", (index,)
+            )
+            if not rows:
+                return None
+            url, data = rows[0]
+            if self._execute(f"DELETE FROM {CACHE_KEY_FAVORITES} WHERE url = ?", (url,)) is None:
+                return None
+        return json.loads(data)
+
+    def get_download_links(self, page_url: str) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        return self.get_many_download_links([page_url]).get(page_url)
+
+    def get_many_download_links(self, page_urls: List[str]) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+        found = {}
+        fresh_after = time.time() - DOWNLOAD_LINKS_TTL
+        for start in range(0, len(page_urls), 500):
+            batch = page_urls[start:start + 500]
+            rows = self._query(
+                f"SELECT url, data FROM {CACHE_KEY_DOWNLOAD_LINKS} "
+                f"WHERE url IN ({', '.join('?' * len(batch))}) AND fetched_at > ?",
+                (*batch, fresh_after)
+            )
+            found.update((url, json.loads(data)) for url, data in rows)
+        return found
+
+    def set_many_download_links(self, links_by_url: Dict[str, Dict[str, List[Dict[str, str]]]]):
+        if not links_by_url:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {CACHE_KEY_DOWNLOAD_LINKS} (url, data, fetched_at) VALUES (?, ?, ?)",
+                [(url, json.dumps(links, ensure_ascii=False), now) for url, links in links_by_url.items()]
+            )
+
+    def get_host_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: json.loads(data) for host, data in self._query(f"SELECT host, data FROM {CACHE_KEY_HOST_STATS}")}
+
+    def set_host_stats(self, host: str, stats: Dict[str, Any]):
+        self._execute(
+            f"INSERT OR REPLACE INTO {CACHE_KEY_HOST_STATS} (host, data) VALUES (?, ?)",
+            (host, json.dumps(stats))
+        )
+
+    def get_download_queue(self) -> List[Dict[str, Any]]:
+        rows = self._query(f"SELECT data FROM {CACHE_KEY_DOWNLOAD_QUEUE} ORDER BY position")
+        return [json.loads(data) for (data,) in rows]
+
+    def save_download_task(self, task: Dict[str, Any]):
+        self._execute(
+            f"INSERT INTO {CACHE_KEY_DOWNLOAD_QUEUE} (id, position, data) "
+            f"SELECT ?, COALESCE(MAX(position), -1) + 1, ? FROM {CACHE_KEY_DOWNLOAD_QUEUE} WHERE true "
+            f"ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+            (task['id'], json.dumps(task, ensure_ascii=False))
+        )
+
+    def remove_download_task(self, task_id: str):
+        self._execute(f"DELETE FROM {CACHE_KEY_DOWNLOAD_QUEUE} WHERE id = ?", (task_id,))
 
     def get_search_history(self) -> List[Dict[str, Any]]:
-        return self._cache[CACHE_KEY_SEARCH_HISTORY]
+        rows = self._query(
+            f"SELECT query, timestamp FROM {CACHE_KEY_SEARCH_HISTORY} ORDER BY timestamp DESC LIMIT ?",
+            (SEARCH_HISTORY_LIMIT,)
+        )
+        return [{"query": query, "timestamp": timestamp} for query, timestamp in rows]
 
     def add_to_search_history(self, query: str):
-        self._cache[CACHE_KEY_SEARCH_HISTORY] = [
-            item for item in self.get_search_history() if item['query'] != query
-        ]
-        self._cache[CACHE_KEY_SEARCH_HISTORY].insert(0, {"query": query, "timestamp": time.time()})
-        self._cache[CACHE_KEY_SEARCH_HISTORY] = self.get_search_history()[:50]
-        self.save()
+        with self._lock:
+            self._execute(
+                f"INSERT OR REPLACE INTO {CACHE_KEY_SEARCH_HISTORY} (query, timestamp) VALUES (?, ?)",
+                (query, time.time())
+            )
+            self._execute(
+                f"DELETE FROM {CACHE_KEY_SEARCH_HISTORY} WHERE query NOT IN "
+                f"(SELECT query FROM {CACHE_KEY_SEARCH_HISTORY} ORDER BY timestamp DESC LIMIT ?)",
+                (SEARCH_HISTORY_LIMIT,)
+            )
 
     def is_episode_watched(self, episode_url: str) -> bool:
-        return episode_url in self._cache[CACHE_KEY_WATCHED_EPISODES]
+        return bool(self._query(f"SELECT 1 FROM {CACHE_KEY_WATCHED_EPISODES} WHERE url = ?", (episode_url,)))
 
     def mark_episode_as_watched(self, episode_url: str):
-        self._cache[CACHE_KEY_WATCHED_EPISODES][episode_url] = time.time()
-        self.save()
+        self._execute(
+            f"INSERT OR REPLACE INTO {CACHE_KEY_WATCHED_EPISODES} (url, timestamp) VALUES (?, ?)",
+            (episode_url, time.time())
+        )
 
     def get_last_episode_check(self, anime_url: str) -> Optional[int]:
-        return self._cache[CACHE_KEY_LAST_EPISODE_CHECK].get(anime_url)
+        rows = self._query(f"SELECT episode_count FROM {CACHE_KEY_LAST_EPISODE_CHECK} WHERE url = ?", (anime_url,))
+        return rows[0][0] if rows else None
 
     def update_last_episode_check(self, anime_url: str, episode_count: int):
-        self._cache[CACHE_KEY_LAST_EPISODE_CHECK][anime_url] = episode_count
-        self.save()
+        self.update_last_episode_checks({anime_url: episode_count})
+
+    def update_last_episode_checks(self, episode_counts: Dict[str, int]):
+        if not episode_counts:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {CACHE_KEY_LAST_EPISODE_CHECK} (url, episode_count) VALUES (?, ?)",
+                list(episode_counts.items())
+            )
+
+    def _count(self, table: str) -> int:
+        return self._query(f"SELECT COUNT(*) FROM {table}")[0][0]
 
     def get_stats(self) -> Dict[str, Any]:
         return {
-            "favorites_count": len(self.get_favorites()),
-            "details_cached_count": len(self.get_all_cached_details()),
-            "search_history_count": len(self.get_search_history()),
-            "watched_episodes_count": len(self._cache[CACHE_KEY_WATCHED_EPISODES]),
-            "cache_file_location": str(CACHE_FILE.resolve())
+            "favorites_count": self._count(CACHE_KEY_FAVORITES),
+            "details_cached_count": self._count(CACHE_KEY_ANIME_DETAILS),
+            "search_history_count": self._count(CACHE_KEY_SEARCH_HISTORY),
+            "watched_episodes_count": self._count(CACHE_KEY_WATCHED_EPISODES),
+            "cache_file_location": str(CACHE_DB_FILE.resolve())
         }
 
     def clear_anime_details_cache(self):
-        self._cache[CACHE_KEY_ANIME_DETAILS] = {}
-        self.save()
+        with self._lock:
+            self._execute(f"DELETE FROM {CACHE_KEY_ANIME_DETAILS}")
+            self._details_size = None
+            self.revision += 1
+            self._details_reset_revision = self.revision
+            self._details_log.clear()
 
     def clear_search_history(self):
         """Membersihkan riwayat pencarian."""
-        self._cache[CACHE_KEY_SEARCH_HISTORY] = []
-        self.save()
+        self._execute(f"DELETE FROM {CACHE_KEY_SEARCH_HISTORY}")
 
     def get_all_data(self) -> Dict[str, Any]:
-        return self._cache
+        with self._lock:
+            return {
+                CACHE_KEY_FAVORITES: self.get_favorites(),
+                CACHE_KEY_ANIME_DETAILS: self.get_all_cached_details(),
+                CACHE_KEY_SEARCH_HISTORY: self.get_search_history(),
+                CACHE_KEY_WATCHED_EPISODES: dict(self._query(f"SELECT url, timestamp FROM {CACHE_KEY_WATCHED_EPISODES}")),
+                CACHE_KEY_LAST_EPISODE_CHECK: dict(self._query(f"SELECT url, episode_count FROM {CACHE_KEY_LAST_EPISODE_CHECK}")),
+                CACHE_KEY_FULL_ANIME_LIST: {
+                    key: json.loads(value)
+                    for key, value in self._query(f"SELECT key, value FROM {CACHE_KEY_FULL_ANIME_LIST}")
+                },
+            }
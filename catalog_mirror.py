@@ -0,0 +1,268 @@
+import json
+import sqlite3
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import parsers
+from cache_manager import is_completed
+from constants import (BASE_URL, CATALOG_DB_FILE, MIRROR_WORKERS, MIRROR_RATE, MIRROR_RETRIES, MIRROR_COMMIT_EVERY,
+                       DETAILS_TTL_ONGOING, DETAILS_TTL_COMPLETED, SYNC_MAX_FEED_PAGES)
+from rate_limiter import RateLimiter
+from scraper import Scraper
+
+CATALOG_SCHEMA_VERSION = 1
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS anime (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    status TEXT,
+    episode_count INTEGER NOT NULL DEFAULT 0,
+    latest_episode REAL,
+    fetched_at REAL NOT NULL,
+    immutable INTEGER NOT NULL DEFAULT 0,
+    data BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS failures (
+    url TEXT PRIMARY KEY,
+    error TEXT,
+    failed_at REAL NOT NULL
+);
+"""
+
+class CatalogStore:
+
+    def __init__(self, path: Path = CATALOG_DB_FILE):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(CATALOG_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(anime)")}
+        if "immutable" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE anime ADD COLUMN immutable INTEGER NOT NULL DEFAULT 0")
+                self._conn.execute("UPDATE anime SET immutable = 1 WHERE lower(status) LIKE '%completed%' OR lower(status) LIKE '%tamat%'")
+        if "latest_episode" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE anime ADD COLUMN latest_episode REAL")
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version < CATALOG_SCHEMA_VERSION:
+            with self._conn:
+                self._conn.executemany("UPDATE anime SET latest_episode = ? WHERE url = ?", [
+                    (parsers.latest_episode_number(self.unpack(data).get('episodes', [])), url)
+                    for url, data in self._conn.execute("SELECT url, data FROM anime").fetchall()
+                ])
+                self._conn.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+
+    @staticmethod
+    def pack(details: Dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(details, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    @staticmethod
+    def unpack(data: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(data))
+
+    def done_urls(self) -> Set[str]:
+        return {url for (url,) in self._conn.execute("SELECT url FROM anime")}
+
+    def put(self, url: str, title: str, details: Dict[str, Any]):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO anime (url, title, status, episode_count, latest_episode, fetched_at, immutable, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (url, title, details.get('status'), len(details.get('episodes', [])),
+             parsers.latest_episode_number(details.get('episodes', [])), time.time(),
+             int(is_completed(details)), self.pack(details))
+        )
+        self._conn.execute("DELETE FROM failures WHERE url = ?", (url,))
+
+    def record_failure(self, url: str, error: str):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO failures (url, error, failed_at) VALUES (?, ?, ?)", (url, error, time.time())
+        )
+
+    def index(self) -> Dict[str, Tuple[str, Optional[float], float, bool]]:
+        return {
+            url: (title, latest_episode, fetched_at, bool(immutable))
+            for url, title, latest_episode, fetched_at, immutable in self._conn.execute(
+                "SELECT url, title, latest_episode, fetched_at, immutable FROM anime"
+            )
+        }
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT data FROM anime WHERE url = ?", (url,)).fetchone()
+        return self.unpack(row[0]) if row else None
+
+    def iter_all(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for url, data in self._conn.execute("SELECT url, data FROM anime ORDER BY title"):
+            yield url, self.unpack(data)
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM anime").fetchone()[0]
+
+    def failure_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM failures").fetchone()[0]
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+class MirrorJob:
+
+    def __init__(self, scraper: Scraper, store: CatalogStore, workers: int = MIRROR_WORKERS,
+                 rate: float = MIRROR_RATE, on_progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.scraper = scraper
+        self.store = store
+        self.workers = max(1, workers)
+        self.rate = min(rate, scraper.transport.scheduler.host_rate(urlparse(BASE_URL).netloc))
+        self.limiter = RateLimiter(self.rate)
+        self.on_progress = on_progress or (lambda stats: None)
+
+    def _fetch(self, url: str) -> Optional[Dict[str, Any]]:
+        for attempt in range(MIRROR_RETRIES):
+            if attempt:
+                time.sleep(0.5 * (2 ** attempt))
+            self.limiter.acquire()
+            details = self.scraper.get_anime_details(url)
+            if details is not None:
+                return details
+        return None
+
+    def run(self, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        anime_list = self.scraper.get_full_anime_list()
+        if anime_list is None: return None
+
+        done = self.store.done_urls()
+        pending = [anime for anime in {a['url']: a for a in anime_list}.values() if anime['url'] not in done]
+        if limit is not None:
+            pending = pending[:limit]
+        return self._fetch_all(pending, {"catalog": len(anime_list), "skipped": len(done)})
+
+    def _fetch_all(self, pending: List[Dict[str, str]], stats: Dict[str, Any]) -> Dict[str, Any]:
+        stats.update({"total": len(pending), "fetched": 0, "failed": 0,
+                      "pages_per_sec": 0.0, "eta_seconds": None, "interrupted": False})
+        started = time.monotonic()
+        queue = iter(pending)
+        in_flight: Dict[Future, Dict[str, str]] = {}
+        since_commit = 0
+        self.on_progress(dict(stats))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            def fill():
+                while len(in_flight) < self.workers * 2:
+                    anime = next(queue, None)
+                    if anime is None: return
+                    in_flight[executor.submit(self._fetch, anime['url'])] = anime
+
+            try:
+                fill()
+                while in_flight:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        anime = in_flight.pop(future)
+                        details = future.result()
+                        if details:
+                            self.store.put(anime['url'], anime['title'], details)
+                            stats["fetched"] += 1
+                        else:
+                            self.store.record_failure(anime['url'], "gagal mengambil detail")
+                            stats["failed"] += 1
+                        since_commit += 1
+
+                    if since_commit >= MIRROR_COMMIT_EVERY:
+                        self.store.commit()
+                        since_commit = 0
+                    processed = stats["fetched"] + stats["failed"]
+                    elapsed = time.monotonic() - started
+                    stats["pages_per_sec"] = processed / elapsed if elapsed > 0 else 0.0
+                    stats["eta_seconds"] = (stats["total"] - processed) / stats["pages_per_sec"] if stats["pages_per_sec"] else None
+                    self.on_progress(dict(stats))
+                    fill()
+            except KeyboardInterrupt:
+                stats["interrupted"] = True
+                for future in in_flight:
+                    future.cancel()
+            finally:
+                self.store.commit()
+
+        stats["elapsed_seconds"] = time.monotonic() - started
+        return stats
+
+def feed_episode_number(entry: Dict[str, str]) -> Optional[float]:
+    text = entry.get('episode', '')
+    match = parsers.EPISODE_NUMBER_PATTERN.search(text) or parsers.NUMBER_PATTERN.search(text)
+    return float(match.group(1).replace(',', '.')) if match else None
+
+class SyncJob(MirrorJob):
+
+    def read_feed(self) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]], int]:
+        ongoing: Dict[str, Dict[str, str]] = {}
+        requests_made = 0
+        for page in range(1, SYNC_MAX_FEED_PAGES + 1):
+            anime_list, has_next_page = self.scraper.get_anime_list('ongoing-anime', page)
+            requests_made += 1
+            for anime in anime_list or []:
+                ongoing.setdefault(anime['url'], anime)
+            if not anime_list or not has_next_page:
+                break
+
+        for anime_list in (self.scraper.get_release_schedule() or {}).values():
+            for anime in anime_list:
+                ongoing.setdefault(anime['url'], anime)
+        requests_made += 1
+
+        recently_completed, _ = self.scraper.get_anime_list('complete-anime', 1)
+        requests_made += 1
+        return ongoing, {anime['url']: anime for anime in recently_completed or []}, requests_made
+
+    def run(self, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        ongoing, completed, feed_requests = self.read_feed()
+        if not ongoing and not completed: return None
+
+        index = self.store.index()
+        now = time.time()
+        pending: Dict[str, Dict[str, str]] = {}
+        reasons = {"new": 0, "changed": 0, "due": 0, "completed": 0, "stale": 0}
+
+        def schedule(anime: Dict[str, str], reason: str):
+            if anime['url'] not in pending:
+                pending[anime['url']] = anime
+                reasons[reason] += 1
+
+        for url, anime in ongoing.items():
+            if url not in index:
+                schedule(anime, "new")
+                continue
+            title, stored_latest, fetched_at, immutable = index[url]
+            latest = feed_episode_number(anime)
+            if immutable:
+                continue
+            if latest is not None and stored_latest is not None and latest > stored_latest:
+                schedule(anime, "changed")
+            elif now - fetched_at >= DETAILS_TTL_ONGOING:
+                schedule(anime, "due")
+
+        for url, anime in completed.items():
+            if url not in index:
+                schedule(anime, "new")
+            elif not index[url][3]:
+                schedule(anime, "completed")
+
+        for url, (title, stored_latest, fetched_at, immutable) in index.items():
+            if not immutable and url not in ongoing and now - fetched_at >= DETAILS_TTL_COMPLETED:
+                schedule({"url": url, "title": title}, "stale")
+
+        to_fetch = list(pending.values())
+        if limit is not None:
+            to_fetch = to_fetch[:limit]
+        stats = self._fetch_all(to_fetch, {"feed": len(ongoing) + len(completed), "feed_requests": feed_requests,
+                                           **reasons, "immutable": sum(1 for entry in index.values() if entry[3])})
+        stats["requests"] = feed_requests + stats["fetched"] + stats["failed"]
+        return stats
@@ -1,14 +1,17 @@
 import csv
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from collections import defaultdict
 
 from rich.align import Align
 from rich.console import Console
 from rich.layout import Layout
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.live import Live
+from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TimeRemainingColumn, TransferSpeedColumn
 from rich.prompt import Prompt, Confirm
 from rich.spinner import Spinner
 from rich.table import Table
@@ -18,7 +21,13 @@ from rich.columns import Columns
 
 from cache_manager import CacheManager
 from constants import *
+from host_ranking import HostRanker
+from prefetcher import Prefetcher
+from download_queue import (DownloadQueue, STATUS_QUEUED, STATUS_ACTIVE, STATUS_PAUSED,
+                            STATUS_DONE, STATUS_FAILED, STATUS_CANCELLED)
 from scraper import Scraper
+from search_index import SearchIndex
+from season_resolver import export_season_links, resolve_season
 from themes import CUSTOM_THEME
 from utils import clear_screen, create_header, format_timestamp, show_message
 
@@ -27,24 +36,89 @@ class OtakuCLI:
         self.console = Console(theme=CUSTOM_THEME)
         self.scraper = Scraper()
         self.cache = CacheManager()
+        self.hosts = HostRanker(self.cache)
+        self.downloads = DownloadQueue(self.cache, ranker=self.hosts)
+        self._background = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS)
+        self.prefetch = Prefetcher()
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+        self._search_index: Optional[SearchIndex] = None
+        self._search_index_revision = -1
 
     def run(self):
         try:
             self._check_connection_and_notify()
+            if self.downloads.active_count():
+                self.downloads.start()
             self.main_menu()
         except KeyboardInterrupt:
             self.console.print("\n[warning]Program dihentikan oleh pengguna. Sampai jumpa![/warning]")
         finally:
+            self._background.shutdown(wait=False, cancel_futures=True)
+            self.prefetch.shutdown()
+            self.downloads.stop()
             self.cache.save()
 
+    def _refresh_in_background(self, key: str, refresh):
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def task():
+            try:
+                refresh()
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        self._background.submit(task)
+
+    def _cached_anime_titles(self) -> List[Dict[str, str]]:
+        full_list = self.cache.get_full_anime_list()
+        return [anime for animes in full_list['grouped'].values() for anime in animes] if full_list else []
+
+    def _get_search_index(self) -> SearchIndex:
+        revision = self.cache.revision
+        if self._search_index is not None and self._search_index_revision == revision:
+            return self._search_index
+
+        changed = self.cache.details_changed_since(self._search_index_revision) if self._search_index is not None else None
+        if changed is None:
+            self._search_index = SearchIndex.build(self._cached_anime_titles(), self.cache.get_all_cached_details())
+        else:
+            for url, details in self.cache.get_many_cached_details(changed).items():
+                self._search_index.add_details(url, details)
+            if self.cache.full_list_revision > self._search_index_revision:
+                for anime in self._cached_anime_titles():
+                    self._search_index.add(anime['url'], anime['title'])
+        self._search_index_revision = revision
+        return self._search_index
+
+    def _refresh_full_anime_list(self):
+        full_list = self.scraper.get_full_anime_list()
+        if full_list:
+            self.cache.set_full_anime_list(full_list)
+
+    def _refresh_anime_details(self, anime_url: str):
+        details = self.scraper.get_anime_details(anime_url)
+        if details:
+            self.cache.set_anime_details(anime_url, details)
+
     def _check_connection_and_notify(self):
         clear_screen()
         self.console.print(create_header(f"{EMOJI_HEADER} OTAKUDESU SCRAPER v2.0 {EMOJI_HEADER}"))
         with self.console.status("[bold green]Menghubungi server Otakudesu...[/bold green]"):
-            if not self.scraper.check_connection():
-                show_message(f"Tidak dapat terhubung ke {BASE_URL}. Periksa koneksi internet Anda.", "Koneksi Gagal", "error")
-                exit()
-            self.console.print(f"[success]{EMOJI_SUCCESS} Koneksi ke {BASE_URL} berhasil![/success]\n")
+            connected = self.scraper.check_connection()
+        if not connected:
+            show_message(
+                f"Tidak dapat terhubung ke {BASE_URL}. Periksa koneksi internet Anda.\n"
+                "Aplikasi tetap berjalan dengan data dari cache.",
+                "Koneksi Gagal", "error"
+            )
+            time.sleep(2)
+            return
+        self.console.print(f"[success]{EMOJI_SUCCESS} Koneksi ke {BASE_URL} berhasil![/success]\n")
         
         self._check_new_episodes()
         time.sleep(1)
@@ -56,16 +130,21 @@ class OtakuCLI:
 
         notifications = []
         with self.console.status("[bold blue]Mengecek episode baru untuk favorit...[/bold blue]"):
-            for fav in favorites:
-                last_known_count = self.cache.get_last_episode_check(fav['url'])
-                details = self.scraper.get_anime_details(fav['url'])
-                if details and details.get('episodes'):
-                    current_episode_count = len(details['episodes'])
-                    if last_known_count is None:
-                        self.cache.update_last_episode_check(fav['url'], current_episode_count)
-                    elif current_episode_count > last_known_count:
-                        notifications.append(f"[highlight]{fav['title']}[/highlight] memiliki {current_episode_count - last_known_count} episode baru!")
-                        self.cache.update_last_episode_check(fav['url'], current_episode_count)
+            all_details = self.scraper.get_many_anime_details(fav['url'] for fav in favorites)
+
+        episode_counts = {}
+        for fav in favorites:
+            details = all_details.get(fav['url'])
+            if not details or not details.get('episodes'):
+                continue
+            last_known_count = self.cache.get_last_episode_check(fav['url'])
+            current_episode_count = len(details['episodes'])
+            if last_known_count is None:
+                episode_counts[fav['url']] = current_episode_count
+            elif current_episode_count > last_known_count:
+                notifications.append(f"[highlight]{fav['title']}[/highlight] memiliki {current_episode_count - last_known_count} episode baru!")
+                episode_counts[fav['url']] = current_episode_count
+        self.cache.update_last_episode_checks(episode_counts)
         
         if notifications:
             notif_text = "\n".join(notifications)
@@ -82,7 +161,8 @@ class OtakuCLI:
             status_text = (
                 f"🟢 [bold]Server Aktif:[/bold] [info]{BASE_URL}[/info]\n"
                 f"⭐ [bold]Favorit:[/bold] [info]{stats['favorites_count']}[/info] anime\n"
-                f"💾 [bold]Cache Detail:[/bold] [info]{stats['details_cached_count']}[/info] anime"
+                f"💾 [bold]Cache Detail:[/bold] [info]{stats['details_cached_count']}[/info] anime\n"
+                f"{EMOJI_QUEUE} [bold]Antrean Unduhan:[/bold] [info]{self.downloads.active_count()}[/info] file"
             )
             self.console.print(Panel(status_text, title="[accent]Status Aplikasi[/accent]", border_style="cyan", expand=True))
 
@@ -96,8 +176,9 @@ class OtakuCLI:
                 "7": f"{EMOJI_FAVORITE} Kelola Favorit",
                 "8": f"{EMOJI_HISTORY} Riwayat & Statistik",
                 "9": f"{EMOJI_EXPORT} Ekspor Data",
-                "10": f"{EMOJI_HELP} Bantuan",
-                "11": f"{EMOJI_QUIT} Keluar",
+                "10": f"{EMOJI_QUEUE} Antrean Unduhan",
+                "11": f"{EMOJI_HELP} Bantuan",
+                "12": f"{EMOJI_QUIT} Keluar",
             }
 
             table = Table(show_header=False, border_style="border", expand=True)
@@ -119,13 +200,14 @@ class OtakuCLI:
                 '7': self.manage_favorites_menu,
                 '8': self.history_and_stats_menu,
                 '9': self.export_data_menu,
-                '10': self.show_help_menu,
-                '11': lambda: None,
+                '10': self.download_queue_menu,
+                '11': self.show_help_menu,
+                '12': lambda: None,
             }
             
             action = actions.get(choice)
             if action:
-                if choice == '11':
+                if choice == '12':
                     self.console.print(Panel(f"[success]{EMOJI_SUCCESS} Terima kasih telah menggunakan aplikasi ini! Sampai jumpa![/success]", border_style="success"))
                     break
                 action()
@@ -138,23 +220,43 @@ class OtakuCLI:
             return
 
         self.cache.add_to_search_history(query)
+        index = self._get_search_index()
+        results = index.search(query, titles_only=True)
+        if results:
+            self.display_anime_list(results, f"Hasil Pencarian: '{query}' (Indeks Lokal)")
+            return
+
         with self.console.status(f"[bold green]Mencari '{query}'...[/bold green]"):
             results = self.scraper.search_anime(query)
-        
+
+        if not results:
+            local_results = index.search(query)
+            if local_results:
+                self.display_anime_list(local_results, f"Hasil Pencarian: '{query}' (Indeks Lokal)")
+                return
         self.display_anime_list(results, f"Hasil Pencarian: '{query}'")
 
     def anime_list_menu(self, list_type: str, title: str):
-        page = 1
+        try:
+            self._anime_list_pages(list_type, title, 1)
+        finally:
+            self.prefetch.cancel("anime_list")
+
+    def _anime_list_pages(self, list_type: str, title: str, page: int):
         while True:
             clear_screen()
             self.console.print(create_header(f"{EMOJI_ONGOING if 'ongoing' in list_type else EMOJI_COMPLETED} {title} - Halaman {page}"))
             with self.console.status("[bold green]Memuat daftar anime...[/bold green]"):
-                result, has_next_page = self.scraper.get_anime_list(list_type, page)
+                prefetched = self.prefetch.take("anime_list", (list_type, page))
+                result, has_next_page = prefetched if prefetched and prefetched[0] else self.scraper.get_anime_list(list_type, page)
             
             if not result:
                 show_message("Tidak ada anime di halaman ini atau halaman terakhir tercapai.", "Info", "warning")
                 break
             
+            if has_next_page:
+                next_page = page + 1
+                self.prefetch.submit("anime_list", (list_type, next_page), lambda: self.scraper.get_anime_list(list_type, next_page))
             self.display_anime_list(result, f"{title} - Halaman {page}")
 
             if has_next_page:
@@ -170,21 +272,20 @@ class OtakuCLI:
         clear_screen()
         self.console.print(create_header(f"{EMOJI_ALL_ANIME} Daftar Lengkap Anime (A-Z)"))
         
-        with self.console.status("[bold green]Mengambil seluruh daftar anime dari situs... Ini mungkin perlu beberapa saat.[/bold green]"):
-            full_list = self.scraper.get_full_anime_list()
+        cached = self.cache.get_full_anime_list()
+        if cached:
+            grouped_anime = cached['grouped']
+            if self.cache.is_full_anime_list_stale():
+                self._refresh_in_background(CACHE_KEY_FULL_ANIME_LIST, self._refresh_full_anime_list)
+        else:
+            with self.console.status("[bold green]Mengambil seluruh daftar anime dari situs... Ini mungkin perlu beberapa saat.[/bold green]"):
+                full_list = self.scraper.get_full_anime_list()
 
-        if not full_list:
-            show_message("Gagal mengambil daftar anime lengkap.", "Error", "error")
-            Prompt.ask("[dim]Tekan Enter untuk kembali...[/dim]")
-            return
-        
-        grouped_anime = defaultdict(list)
-        for anime in full_list:
-            first_letter = anime['title'][0].upper() if anime['title'] else '#'
-            if first_letter.isalpha():
-                grouped_anime[first_letter].append(anime)
-            else:
-                grouped_anime['#'].append(anime)
+            if not full_list:
+                show_message("Gagal mengambil daftar anime lengkap.", "Error", "error")
+                Prompt.ask("[dim]Tekan Enter untuk kembali...[/dim]")
+                return
+            grouped_anime = self.cache.set_full_anime_list(full_list)
 
         while True:
             clear_screen()
@@ -194,8 +295,7 @@ class OtakuCLI:
             table.add_column("Huruf", style="accent", justify="center")
             table.add_column("Jumlah Anime", style="info", justify="center")
 
-            sorted_letters = sorted(grouped_anime.keys())
-            for letter in sorted_letters:
+            for letter in grouped_anime:
                 table.add_row(letter, str(len(grouped_anime[letter])))
             
             self.console.print(table)
@@ -355,6 +455,8 @@ class OtakuCLI:
                 if details:
                     self.cache.set_anime_details(anime_url, details)
         else:
+            if self.cache.is_anime_details_stale(anime_url):
+                self._refresh_in_background(anime_url, lambda: self._refresh_anime_details(anime_url))
             self.console.print("[info]Memuat detail dari cache...[/info]")
             time.sleep(0.5)
 
@@ -363,6 +465,21 @@ class OtakuCLI:
             Prompt.ask("[dim]Tekan Enter untuk kembali...[/dim]")
             return
 
+        try:
+            self._show_anime_details(details)
+        finally:
+            self.prefetch.cancel("details")
+
+    def _next_unwatched_episode(self, episodes: List[Dict]) -> Optional[Dict]:
+        watched = [i for i, ep in enumerate(episodes) if self.cache.is_episode_watched(ep['url'])]
+        start = watched[-1] + 1 if watched else 0
+        return episodes[start] if start < len(episodes) else None
+
+    def _show_anime_details(self, details: Dict[str, Any]):
+        next_episode = self._next_unwatched_episode(details.get('episodes', []))
+        if next_episode:
+            self.prefetch.submit("details", next_episode['url'], lambda: self._get_download_links(next_episode['url']))
+
         while True:
             clear_screen()
             self.console.print(create_header(details.get('title', 'Detail Anime')))
@@ -428,11 +545,23 @@ class OtakuCLI:
                 table.add_row(str(i + 1), ep['title'], watched_status)
             self.console.print(table)
 
-            self.console.print(Panel.fit(f"• Masukkan [highlight]nomor[/highlight] untuk melihat link unduhan\n• Ketik [highlight]'k'[/highlight] untuk kembali {EMOJI_BACK}", title="[accent]Kontrol[/accent]"))
+            self.console.print(Panel.fit(
+                f"• Masukkan [highlight]nomor[/highlight] untuk melihat link unduhan\n"
+                f"• Ketik [highlight]'u'[/highlight] untuk memasukkan semua episode ke antrean unduhan {EMOJI_QUEUE}\n"
+                f"• Ketik [highlight]'s'[/highlight] untuk mengekspor semua link unduhan season ini {EMOJI_EXPORT}\n"
+                f"• Ketik [highlight]'k'[/highlight] untuk kembali {EMOJI_BACK}",
+                title="[accent]Kontrol[/accent]"
+            ))
             choice_str = Prompt.ask("[prompt]➤ Pilihan Anda[/prompt]").lower().strip()
 
             if choice_str == 'k':
                 break
+            if choice_str == 'u':
+                self._enqueue_episodes(episodes, anime_title)
+                continue
+            if choice_str == 's':
+                self._export_season_links(episodes, anime_title)
+                continue
             try:
                 idx = int(choice_str) - 1
                 if 0 <= idx < len(episodes):
@@ -474,9 +603,17 @@ class OtakuCLI:
             except ValueError:
                 show_message("Input tidak valid.", "Error", "error")
 
+    def _get_download_links(self, url: str) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        links = self.cache.get_download_links(url)
+        if links is None:
+            links = self.scraper.get_download_links(url)
+            if links:
+                self.cache.set_many_download_links({url: links})
+        return self.hosts.rank_all(links) if links else links
+
     def display_download_links(self, url: str, title: str):
         with self.console.status(f"[bold green]Mengambil link untuk {title}...[/bold green]"):
-            links = self.scraper.get_download_links(url)
+            links = self._get_download_links(url)
 
         if not links:
             show_message("Gagal mengambil link download atau tidak ada link yang ditemukan.", "Error", "error")
@@ -493,14 +630,16 @@ class OtakuCLI:
             for resolution, link_list in links.items():
                 res_branch = tree.add(f"[info]✨ {resolution}[/info]")
                 for link in link_list:
-                    res_branch.add(f"({counter}) [green]{link['host']}[/green]")
-                    link_map[counter] = link
+                    host_info = self.hosts.describe(link['host'])
+                    res_branch.add(f"({counter}) [green]{link['host']}[/green]" + (f" [dim]({host_info})[/dim]" if host_info else ""))
+                    link_map[counter] = (resolution, link)
                     counter += 1
             
             self.console.print(tree)
             self.console.print(Panel.fit(
                 f"• Masukkan [highlight]nomor[/highlight] untuk menampilkan URL unduhan\n"
                 f"• URL ini dapat Anda [highlight]salin[/highlight] dan tempel di browser atau manajer unduhan\n"
+                f"• Ketik [highlight]'a <nomor>'[/highlight] untuk menambahkan ke antrean unduhan {EMOJI_QUEUE}\n"
                 f"• Ketik [highlight]'k'[/highlight] untuk kembali {EMOJI_BACK}", 
                 title="[accent]Kontrol[/accent]"
             ))
@@ -508,11 +647,22 @@ class OtakuCLI:
             choice_str = Prompt.ask("[prompt]➤ Pilihan Anda[/prompt]").lower().strip()
             if choice_str == 'k':
                 break
+            if choice_str.startswith('a '):
+                try:
+                    resolution, selected_link = link_map[int(choice_str.split(' ')[1])]
+                    self.downloads.enqueue(selected_link['url'], f"{title} {resolution} {selected_link['host']}", source=url,
+                                           host=selected_link['host'])
+                    self.cache.mark_episode_as_watched(url)
+                    show_message(f"'{title}' ditambahkan ke antrean unduhan.", "Sukses", "success")
+                    time.sleep(1.5)
+                except (ValueError, IndexError, KeyError):
+                    show_message("Format salah. Contoh: a 1", "Error", "error")
+                continue
             
             try:
                 choice_idx = int(choice_str)
                 if choice_idx in link_map:
-                    selected_link = link_map[choice_idx]
+                    _, selected_link = link_map[choice_idx]
                     self.console.print(Panel(
                         f"[bold]Host:[/bold] {selected_link['host']}\n"
                         f"[bold]URL:[/bold] [link={selected_link['url']}]{selected_link['url']}[/link]",
@@ -527,6 +677,157 @@ class OtakuCLI:
             except ValueError:
                 show_message("Input tidak valid.", "Error", "error")
 
+    def _resolve_season(self, episodes: List[Dict]) -> Dict[str, Dict[str, Any]]:
+        with self.console.status(f"[bold green]Mengambil link unduhan untuk {len(episodes)} episode...[/bold green]"):
+            return resolve_season(self.scraper, self.cache, episodes, ranker=self.hosts)
+
+    def _export_season_links(self, episodes: List[Dict], anime_title: str):
+        season = self._resolve_season(episodes)
+        resolved = sum(1 for episode in season.values() if episode['links'])
+        format_choice = Prompt.ask("[prompt]Format ekspor: (1) JSON, (2) CSV[/prompt]", choices=['1', '2'])
+        try:
+            filepath = export_season_links(season, anime_title, "json" if format_choice == '1' else "csv")
+            show_message(f"Link {resolved}/{len(episodes)} episode diekspor ke:\n{filepath}", "Ekspor Sukses", "success")
+        except OSError as e:
+            show_message(f"Gagal mengekspor data: {e}", "Error", "error")
+        Prompt.ask("[dim]Tekan Enter untuk kembali...[/dim]")
+
+    def _enqueue_episodes(self, episodes: List[Dict], anime_title: str):
+        season = self._resolve_season(episodes)
+        links_by_episode = {url: episode['links'] for url, episode in season.items()}
+
+        resolutions = list(dict.fromkeys(res for links in links_by_episode.values() for res in links))
+        if not resolutions:
+            show_message("Tidak ada link unduhan yang ditemukan.", "Error", "error")
+            time.sleep(1.5)
+            return
+
+        self.console.print(Panel.fit(
+            "\n".join(f"({i + 1}) {res}" for i, res in enumerate(resolutions)),
+            title="[accent]Pilih Resolusi[/accent]"
+        ))
+        resolution = resolutions[int(Prompt.ask("[prompt]➤ Resolusi[/prompt]", choices=[str(i + 1) for i in range(len(resolutions))])) - 1]
+
+        hosts = list(dict.fromkeys(host for links in links_by_episode.values() for host in links.get(resolution, {})))
+        host_choice = Prompt.ask(
+            f"[prompt]➤ Server yang diutamakan ({', '.join(hosts)}), kosongkan untuk otomatis[/prompt]", default=""
+        ).strip().lower()
+        priority = Prompt.ask("[prompt]➤ Prioritas (angka lebih besar diunduh lebih dulu)[/prompt]", default="0")
+        priority = int(priority) if priority.lstrip('-').isdigit() else 0
+
+        added, missing = 0, []
+        for ep in episodes:
+            candidates = links_by_episode.get(ep['url'], {}).get(resolution, {})
+            if not candidates:
+                missing.append(ep['title'])
+                continue
+            host = next((name for name in candidates if name.lower() == host_choice), next(iter(candidates)))
+            self.downloads.enqueue(candidates[host], f"{ep['title']} {resolution} {host}", priority=priority,
+                                   source=ep['url'], anime=anime_title, host=host)
+            added += 1
+
+        message = f"{added} episode {anime_title} ({resolution}) ditambahkan ke antrean unduhan."
+        if missing:
+            message += f"\n{len(missing)} episode tidak memiliki resolusi ini."
+        show_message(message, "Antrean Unduhan", "success" if added else "warning")
+        time.sleep(2)
+
+    def _download_progress_view(self):
+        progress = Progress(
+            TextColumn("[bold blue]{task.fields[filename]}", justify="right"),
+            TextColumn("[dim]{task.fields[status]}[/dim]"),
+            BarColumn(bar_width=None),
+            "[progress.percentage]{task.percentage:>3.1f}%",
+            "•",
+            DownloadColumn(),
+            "•",
+            TransferSpeedColumn(),
+            "•",
+            TimeRemainingColumn(),
+        )
+        progress_ids = {}
+        self.console.print("[dim]Tekan Ctrl+C untuk kembali ke menu antrean (unduhan tetap berjalan).[/dim]")
+        try:
+            with Live(progress, console=self.console, refresh_per_second=4):
+                while True:
+                    tasks = self.downloads.snapshot()
+                    for task in tasks:
+                        if task['id'] not in progress_ids:
+                            progress_ids[task['id']] = progress.add_task("download", filename=task['title'][:40], status=task['status'], total=task['total'])
+                        progress.update(progress_ids[task['id']], completed=task['downloaded'], total=task['total'], status=task['status'])
+                    if not any(task['status'] in (STATUS_QUEUED, STATUS_ACTIVE) for task in tasks):
+                        break
+                    time.sleep(0.5)
+        except KeyboardInterrupt:
+            pass
+
+    def download_queue_menu(self):
+        status_styles = {
+            STATUS_QUEUED: "info", STATUS_ACTIVE: "highlight", STATUS_PAUSED: "warning",
+            STATUS_DONE: "success", STATUS_FAILED: "error", STATUS_CANCELLED: "dim",
+        }
+        while True:
+            clear_screen()
+            self.console.print(create_header(f"{EMOJI_QUEUE} Antrean Unduhan"))
+            tasks = self.downloads.snapshot()
+
+            table = Table(title="[highlight]Daftar Unduhan[/highlight]", border_style="cyan")
+            table.add_column("No.", width=5)
+            table.add_column("File")
+            table.add_column("Prioritas", justify="center")
+            table.add_column("Status", justify="center")
+            table.add_column("Progres", justify="right")
+            for i, task in enumerate(tasks):
+                percent = f"{task['downloaded'] * 100 / task['total']:.1f}%" if task.get('total') else "-"
+                style = status_styles.get(task['status'], "info")
+                status = f"[{style}]{task['status']}[/{style}]"
+                if task.get('error'):
+                    status += f"\n[dim]{task['error'][:60]}[/dim]"
+                table.add_row(str(i + 1), task['title'], str(task['priority']), status, percent)
+            if tasks:
+                self.console.print(table)
+            else:
+                show_message("Antrean unduhan kosong.", "Info", "warning")
+
+            self.console.print(Panel.fit(
+                f"• Tekan [highlight]Enter[/highlight] untuk menyegarkan, [highlight]'l'[/highlight] untuk progres langsung\n"
+                f"• [highlight]'j <nomor>'[/highlight] jeda, [highlight]'r <nomor>'[/highlight] lanjutkan, [highlight]'b <nomor>'[/highlight] batalkan\n"
+                f"• [highlight]'p <nomor> <prioritas>'[/highlight] ubah prioritas, [highlight]'h'[/highlight] hapus yang sudah selesai\n"
+                f"• Ketik [highlight]'k'[/highlight] untuk kembali {EMOJI_BACK}",
+                title="[accent]Kontrol Antrean[/accent]", border_style="border"
+            ))
+            choice = Prompt.ask("[prompt]➤ Pilihan Anda[/prompt]", default="").lower().strip()
+
+            if choice == 'k':
+                break
+            elif choice == '':
+                continue
+            elif choice == 'l':
+                self._download_progress_view()
+            elif choice == 'h':
+                removed = self.downloads.clear_finished()
+                show_message(f"{removed} unduhan dihapus dari daftar.", "Sukses", "success")
+                time.sleep(1)
+            else:
+                parts = choice.split()
+                actions = {'j': self.downloads.pause, 'r': self.downloads.resume, 'b': self.downloads.cancel}
+                try:
+                    idx = int(parts[1]) - 1
+                    if not 0 <= idx < len(tasks):
+                        raise IndexError
+                    if parts[0] == 'p':
+                        done = self.downloads.set_priority(tasks[idx]['id'], int(parts[2]))
+                    elif parts[0] in actions:
+                        done = actions[parts[0]](tasks[idx]['id'])
+                    else:
+                        raise ValueError
+                    if not done:
+                        show_message("Aksi tidak dapat diterapkan pada unduhan ini.", "Info", "warning")
+                        time.sleep(1.5)
+                except (ValueError, IndexError):
+                    show_message("Format salah. Contoh: j 1 atau p 2 5", "Error", "error")
+                    time.sleep(1.5)
+
     def manage_favorites_menu(self):
         while True:
             clear_screen()
@@ -583,13 +884,32 @@ class OtakuCLI:
             self.console.print(create_header(f"{EMOJI_HISTORY} Riwayat & Statistik"))
 
             stats = self.cache.get_stats()
+            http_stats = self.scraper.transport.get_metrics()
+            flight_stats = self.scraper.flight.get_stats()
+            result_stats = self.scraper.results.get_stats()
+            http_store = self.scraper.http_store
             stats_text = (
                 f"⭐ [bold]Total Favorit:[/bold] [info]{stats['favorites_count']}[/info]\n"
                 f"💾 [bold]Detail di Cache:[/bold] [info]{stats['details_cached_count']}[/info]\n"
                 f"🕘 [bold]Riwayat Pencarian:[/bold] [info]{stats['search_history_count']}[/info]\n"
                 f"✅ [bold]Episode Ditonton:[/bold] [info]{stats['watched_episodes_count']}[/info]\n"
+                f"🔁 [bold]Request HTTP:[/bold] [info]{http_stats['requests']}[/info] "
+                f"(retry: [info]{http_stats['retries']}[/info], gagal: [info]{http_stats['failures']}[/info], "
+                f"circuit trip: [info]{http_stats['circuit_trips']}[/info], dibatasi server: [info]{http_stats['throttled']}[/info])\n"
+                f"🔗 [bold]Permintaan Digabung:[/bold] [info]{flight_stats['shared']}[/info]\n"
+                f"🧠 [bold]Hasil di Memori:[/bold] [info]{result_stats['entries']}[/info] "
+                f"([info]{result_stats['bytes'] / 1024 / 1024:.1f}/{result_stats['max_bytes'] / 1024 / 1024:.0f} MB[/info], "
+                f"hit: [info]{result_stats['hits']}[/info], miss: [info]{result_stats['misses']}[/info], "
+                f"dibuang: [info]{result_stats['evictions']}[/info])\n"
+                f"🌐 [bold]Halaman HTTP Tersimpan:[/bold] [info]{http_store.count()}[/info] "
+                f"([info]{http_store.size_bytes() / 1024 / 1024:.1f}/{http_store.max_bytes / 1024 / 1024:.0f} MB[/info])\n"
                 f"📁 [bold]Lokasi Cache:[/bold] [dim]{stats['cache_file_location']}[/dim]"
             )
+            for host, state in self.scraper.transport.get_scheduler_state().items():
+                stats_text += (
+                    f"\n🚦 [bold]{host}:[/bold] token [info]{state['tokens']}/{state['burst']:g}[/info], "
+                    f"laju [info]{state['rate']}/{state['base_rate']:g}[/info] req/s, antre [info]{state['waiting']}[/info]"
+                )
             self.console.print(Panel(stats_text, title="[highlight]📊 Statistik Aplikasi[/highlight]", border_style="cyan"))
 
             history = self.cache.get_search_history()
@@ -612,9 +932,16 @@ class OtakuCLI:
 
             if Confirm.ask("[prompt]Apakah Anda ingin membersihkan cache [bold]detail anime[/bold]?[/prompt]", default=False):
                 self.cache.clear_anime_details_cache()
+                self.scraper.results.clear()
                 show_message("Cache detail anime telah dibersihkan!", "Sukses", "success")
                 time.sleep(1.5)
                 continue
+
+            if Confirm.ask("[prompt]Apakah Anda ingin membersihkan cache [bold]halaman HTTP[/bold]?[/prompt]", default=False):
+                self.scraper.http_store.clear()
+                show_message("Cache halaman HTTP telah dibersihkan!", "Sukses", "success")
+                time.sleep(1.5)
+                continue
             
             break
 
@@ -689,6 +1016,7 @@ class OtakuCLI:
         ## Fitur Unduhan (v7)
         - **{EMOJI_DOWNLOAD} Tampilkan URL**: Fitur auto-downloader telah diganti. Sekarang, memilih link akan **menampilkan URL final**.
         - **Salin & Tempel**: Anda bisa menyalin URL tersebut dan menempelkannya di browser atau manajer unduhan (IDM, dll) untuk hasil yang lebih andal.
+        - **{EMOJI_QUEUE} Antrean Unduhan**: Ketik `a <nomor>` di daftar link, atau `u` di daftar episode untuk mengantrekan satu season pada resolusi tertentu. Antrean tersimpan dan dilanjutkan saat aplikasi dibuka lagi.
 
         Terima kasih telah menggunakan aplikasi ini!
         """
@@ -1,13 +1,18 @@
+import os
 from pathlib import Path
+from urllib.parse import urlparse
 
-BASE_URL = "https://otakudesu.cloud"
+BASE_URL = os.environ.get("OTAKUDESU_BASE_URL", "https://otakudesu.cloud").rstrip("/")
 
 APP_DIR = Path(__file__).parent
-DATA_DIR = APP_DIR / "data"
+DATA_DIR = Path(os.environ.get("OTAKUDESU_DATA_DIR", APP_DIR / "data"))
 EXPORT_DIR = APP_DIR / "exports"
 CACHE_FILE = DATA_DIR / "cache.json"
+CACHE_DB_FILE = DATA_DIR / "cache.db"
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+CATALOG_DB_FILE = DATA_DIR / "catalog.db"
 
-DATA_DIR.mkdir(exist_ok=True)
+DATA_DIR.mkdir(parents=True, exist_ok=True)
 EXPORT_DIR.mkdir(exist_ok=True)
 
 EMOJI_HEADER = "🎌"
@@ -30,6 +35,7 @@ EMOJI_ERROR = "❌"
 EMOJI_WARNING = "⚠️"
 EMOJI_INFO = "ℹ️"
 EMOJI_BACK = "↩️"
+EMOJI_QUEUE = "📦"
 
 CACHE_KEY_FAVORITES = "favorites"
 CACHE_KEY_ANIME_DETAILS = "anime_details"
@@ -37,6 +43,9 @@ CACHE_KEY_SEARCH_HISTORY = "search_history"
 CACHE_KEY_WATCHED_EPISODES = "watched_episodes"
 CACHE_KEY_LAST_EPISODE_CHECK = "last_episode_check"
 CACHE_KEY_FULL_ANIME_LIST = "full_anime_list"
+CACHE_KEY_DOWNLOAD_QUEUE = "download_queue"
+CACHE_KEY_DOWNLOAD_LINKS = "download_links"
+CACHE_KEY_HOST_STATS = "host_stats"
 
 DEFAULT_CACHE = {
     CACHE_KEY_FAVORITES: [],
@@ -47,6 +56,72 @@ DEFAULT_CACHE = {
     CACHE_KEY_FULL_ANIME_LIST: {}
 }
 
+DETAILS_TTL_ONGOING = 6 * 60 * 60
+DETAILS_TTL_COMPLETED = 30 * 24 * 60 * 60
+DETAILS_CACHE_MAX_ENTRIES = 5000
+DETAILS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+FULL_ANIME_LIST_TTL = 24 * 60 * 60
+DOWNLOAD_LINKS_TTL = 90 * 24 * 60 * 60
+HTTP_CACHE_TTL = 7 * 24 * 60 * 60
+HTTP_CACHE_MAX_ENTRIES = 2000
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+HTTP_CACHE_PRUNE_EVERY = 50
+
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 20
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 30
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30
+
+FAVORITES_CHECK_WORKERS = 8
+BACKGROUND_WORKERS = 2
+GENRE_CRAWL_WORKERS = 4
+GENRE_CRAWL_RATE = 5.0
+SEASON_RESOLVE_WORKERS = 6
+SEASON_RESOLVE_RATE = 8.0
+MIRROR_WORKERS = 4
+MIRROR_RATE = 4.0
+MIRROR_RETRIES = 3
+MIRROR_COMMIT_EVERY = 25
+SYNC_MAX_FEED_PAGES = 10
+MAX_CONNECTIONS_PER_HOST = 4
+SCHEDULER_DEFAULT_RATE = 4.0
+SCHEDULER_DEFAULT_BURST = 8
+SCHEDULER_HOST_LIMITS = {urlparse(BASE_URL).netloc: (8.0, 16)}
+SCHEDULER_MIN_RATE = 0.25
+SCHEDULER_BACKOFF_FACTOR = 0.5
+SCHEDULER_RECOVERY_STEP = 0.05
+SCHEDULER_THROTTLE_STATUSES = (429, 503)
+SCHEDULER_MAX_WAIT_STEP = 0.25
+
+HTTP_POOL_HOSTS = 10
+HTTP_POOL_SIZE = max(FAVORITES_CHECK_WORKERS, GENRE_CRAWL_WORKERS, MAX_CONNECTIONS_PER_HOST) + BACKGROUND_WORKERS
+HTTP2_ENABLED = False
+ASYNC_MAX_CONCURRENCY = 32
+PREFETCH_WORKERS = 2
+PREFETCH_MAX_PENDING = 4
+RESULT_CACHE_TTL = 5 * 60
+RESULT_CACHE_MAX_ENTRIES = 2000
+RESULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+DOWNLOAD_SEGMENTS = 4
+DOWNLOAD_MIN_SEGMENT_SIZE = 4 * 1024 * 1024
+DOWNLOAD_CHUNK_MIN = 64 * 1024
+DOWNLOAD_CHUNK_MAX = 4 * 1024 * 1024
+DOWNLOAD_SEGMENT_RETRIES = 5
+DOWNLOAD_STATE_INTERVAL = 1.0
+DOWNLOAD_QUEUE_WORKERS = 3
+DOWNLOAD_QUEUE_PER_HOST = 2
+HOST_STATS_SMOOTHING = 0.3
+HOST_DEFAULT_LATENCY = 1.0
+HOST_DEFAULT_SPEED = 1024 * 1024
+HOST_RANK_REFERENCE_BYTES = 100 * 1024 * 1024
+
+PARSER_BACKEND = "lxml"
+
 HTTP_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Accept-Language': 'id-ID,id;q=0.9,en;q=0.8',
@@ -0,0 +1,232 @@
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from cache_manager import CacheManager
+from constants import EXPORT_DIR, DOWNLOAD_QUEUE_WORKERS, DOWNLOAD_QUEUE_PER_HOST
+from downloader import DownloadCancelled, SegmentedDownloader, safe_filename
+from host_ranking import HostRanker
+from transport import Transport
+
+STATUS_QUEUED = "antre"
+STATUS_ACTIVE = "mengunduh"
+STATUS_PAUSED = "dijeda"
+STATUS_DONE = "selesai"
+STATUS_FAILED = "gagal"
+STATUS_CANCELLED = "dibatalkan"
+FINISHED_STATUSES = (STATUS_DONE, STATUS_FAILED, STATUS_CANCELLED)
+
+class DownloadQueue:
+
+    def __init__(self, cache: CacheManager, max_workers: int = DOWNLOAD_QUEUE_WORKERS,
+                 per_host: int = DOWNLOAD_QUEUE_PER_HOST, transport: Optional[Transport] = None,
+                 ranker: Optional[HostRanker] = None):
+        self.cache = cache
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.transport = transport
+        self.ranker = ranker
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._stop_events: Dict[str, threading.Event] = {}
+        self._cond = threading.Condition()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+        for task in cache.get_download_queue():
+            if task['status'] == STATUS_ACTIVE:
+                task['status'] = STATUS_QUEUED
+            self._tasks[task['id']] = task
+
+    @staticmethod
+    def task_id(url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]
+
+    def _persist(self, task: Dict[str, Any]):
+        self.cache.save_download_task(dict(task))
+
+    def start(self):
+        with self._cond:
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, name="download-queue", daemon=True)
+                self._dispatcher.start()
+
+    def stop(self, timeout: float = 5.0):
+        with self._cond:
+            self._closed = True
+            for event in self._stop_events.values():
+                event.set()
+            self._cond.notify_all()
+            workers = list(self._workers)
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+
+    def enqueue(self, url: str, title: str, priority: int = 0, **metadata) -> Dict[str, Any]:
+        task_id = self.task_id(url)
+        with self._cond:
+            existing = self._tasks.get(task_id)
+            if existing and existing['status'] not in FINISHED_STATUSES:
+                return existing
+            destination = EXPORT_DIR / safe_filename(title)
+            if any(other['destination'] == str(destination) and other['id'] != task_id for other in self._tasks.values()):
+                destination = destination.with_name(f"{destination.stem} {task_id}{destination.suffix}")
+            task = {
+                'id': task_id,
+                'url': url,
+                'title': title,
+                'destination': str(destination),
+                'priority': priority,
+                'status': STATUS_QUEUED,
+                'downloaded': 0,
+                'total': None,
+                'error': None,
+                'added_at': time.time(),
+                **metadata,
+            }
+            self._tasks[task_id] = task
+            self._persist(task)
+            self._cond.notify_all()
+        self.start()
+        return task
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            return [dict(task) for task in self._ordered()]
+
+    def _ordered(self) -> List[Dict[str, Any]]:
+        return sorted(self._tasks.values(), key=lambda task: (-task['priority'], task['added_at']))
+
+    def _set_status(self, task_id: str, status: str, stop_running: bool = False) -> bool:
+        with self._cond:
+            task = self._tasks.get(task_id)
+            if not task: return False
+            if task['status'] == STATUS_ACTIVE and stop_running:
+                self._stop_events[task_id].set()
+            task['status'] = status
+            self._persist(task)
+            self._cond.notify_all()
+            return True
+
+    def pause(self, task_id: str) -> bool:
+        with self._cond:
+            task = self._tasks.get(task_id)
+            if not task or task['status'] not in (STATUS_QUEUED, STATUS_ACTIVE): return False
+            return self._set_status(task_id, STATUS_PAUSED, stop_running=True)
+
+    def resume(self, task_id: str) -> bool:
+        with self._cond:
+            task = self._tasks.get(task_id)
+            if not task or task['status'] not in (STATUS_PAUSED, STATUS_FAILED): return False
+            task['error'] = None
+            self._set_status(task_id, STATUS_QUEUED)
+        self.start()
+        return True
+
+    def cancel(self, task_id: str) -> bool:
+        with self._cond:
+            task = self._tasks.get(task_id)
+            if not task or task['status'] in (STATUS_DONE, STATUS_CANCELLED): return False
+            was_active = task['status'] == STATUS_ACTIVE
+            self._set_status(task_id, STATUS_CANCELLED, stop_running=True)
+        if not was_active:
+            self._discard_partial(task)
+        return True
+
+    def set_priority(self, task_id: str, priority: int) -> bool:
+        with self._cond:
+            task = self._tasks.get(task_id)
+            if not task: return False
+            task['priority'] = priority
+            self._persist(task)
+            self._cond.notify_all()
+            return True
+
+    def clear_finished(self) -> int:
+        with self._cond:
+            finished = [task_id for task_id, task in self._tasks.items() if task['status'] in FINISHED_STATUSES]
+            for task_id in finished:
+                del self._tasks[task_id]
+                self.cache.remove_download_task(task_id)
+            return len(finished)
+
+    def active_count(self) -> int:
+        with self._cond:
+            return sum(1 for task in self._tasks.values() if task['status'] in (STATUS_QUEUED, STATUS_ACTIVE))
+
+    @staticmethod
+    def _discard_partial(task: Dict[str, Any]):
+        downloader = SegmentedDownloader(task['url'], Path(task['destination']))
+        downloader.part_path.unlink(missing_ok=True)
+        downloader.state_path.unlink(missing_ok=True)
+
+    def _next_task(self) -> Optional[Dict[str, Any]]:
+        running = [task for task in self._tasks.values() if task['status'] == STATUS_ACTIVE]
+        if len(running) >= self.max_workers: return None
+        busy_hosts: Dict[str, int] = {}
+        for task in running:
+            host = urlparse(task['url']).netloc
+            busy_hosts[host] = busy_hosts.get(host, 0) + 1
+        for task in self._ordered():
+            if task['status'] == STATUS_QUEUED and busy_hosts.get(urlparse(task['url']).netloc, 0) < self.per_host:
+                return task
+        return None
+
+    def _dispatch(self):
+        while True:
+            with self._cond:
+                task = None
+                while not self._closed:
+                    task = self._next_task()
+                    if task: break
+                    self._cond.wait()
+                if self._closed: return
+                task['status'] = STATUS_ACTIVE
+                self._stop_events[task['id']] = threading.Event()
+                self._persist(task)
+                worker = threading.Thread(target=self._run, args=(task,), name=f"download-{task['id']}", daemon=True)
+                self._workers = [thread for thread in self._workers if thread.is_alive()] + [worker]
+            worker.start()
+
+    def _run(self, task: Dict[str, Any]):
+        task['downloaded'] = 0
+
+        def on_progress(advance: int):
+            task['downloaded'] += advance
+
+        def on_start(total_size: Optional[int]):
+            task['total'] = total_size
+
+        downloader = SegmentedDownloader(task['url'], Path(task['destination']), transport=self.transport,
+                                         on_progress=on_progress, on_start=on_start,
+                                         stop_event=self._stop_events[task['id']])
+        status, error = STATUS_DONE, None
+        started = time.monotonic()
+        try:
+            downloader.run()
+        except DownloadCancelled:
+            status = None
+        except Exception as e:
+            status, error = STATUS_FAILED, str(e)
+
+        if self.ranker and status is not None:
+            elapsed = time.monotonic() - started
+            self.ranker.record(
+                task.get('host') or urlparse(task['url']).netloc, status == STATUS_DONE, downloader.probe_latency,
+                downloader.transferred / elapsed if status == STATUS_DONE and downloader.transferred and elapsed > 0 else None,
+            )
+
+        with self._cond:
+            self._stop_events.pop(task['id'], None)
+            if status is None:
+                if task['status'] == STATUS_ACTIVE:
+                    task['status'] = STATUS_QUEUED
+                elif task['status'] == STATUS_CANCELLED:
+                    self._discard_partial(task)
+            else:
+                task['status'], task['error'] = status, error
+            self._persist(task)
+            self._cond.notify_all()
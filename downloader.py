@@ -1,6 +1,14 @@
-import requests
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
 from rich.progress import (
     Progress,
@@ -12,17 +20,214 @@ from rich.progress import (
 )
 from rich.console import Console
 
-from constants import EXPORT_DIR, HTTP_HEADERS
+from constants import (EXPORT_DIR, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, HTTP_BACKOFF_MAX,
+                       DOWNLOAD_SEGMENTS, DOWNLOAD_MIN_SEGMENT_SIZE, DOWNLOAD_CHUNK_MIN,
+                       DOWNLOAD_CHUNK_MAX, DOWNLOAD_SEGMENT_RETRIES, DOWNLOAD_STATE_INTERVAL)
 from themes import CUSTOM_THEME
+from transport import Transport, get_shared_transport
 
 console = Console(theme=CUSTOM_THEME)
 
-def download_file(url: str, title: str) -> Optional[Path]:
-    safe_filename = "".join([c for c in title if c.isalpha() or c.isdigit() or c in (' ', '.', '_')]).rstrip()
-    if not Path(safe_filename).suffix:
-        safe_filename += ".mp4"
-        
-    destination = EXPORT_DIR / safe_filename
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+CONTENT_RANGE_PATTERN = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+|\*)')
+STREAM_ERRORS = (requests.exceptions.RequestException, Urllib3HTTPError)
+
+class DownloadError(Exception):
+    pass
+
+class DownloadCancelled(Exception):
+    pass
+
+def safe_filename(title: str) -> str:
+    filename = "".join([c for c in title if c.isalpha() or c.isdigit() or c in (' ', '.', '_')]).rstrip()
+    if not Path(filename).suffix:
+        filename += ".mp4"
+    return filename
+
+def split_segments(size: int, segments: int) -> List[List[int]]:
+    count = max(1, min(segments, size // DOWNLOAD_MIN_SEGMENT_SIZE))
+    step = -(-size // count)
+    return [[start, min(start + step, size) - 1, 0] for start in range(0, size, step)]
+
+class SegmentedDownloader:
+
+    def __init__(self, url: str, destination: Path, segments: int = DOWNLOAD_SEGMENTS,
+                 transport: Optional[Transport] = None,
+                 on_progress: Optional[Callable[[int], None]] = None,
+                 on_start: Optional[Callable[[Optional[int]], None]] = None,
+                 stop_event: Optional[threading.Event] = None):
+        self.url = url
+        self.destination = Path(destination)
+        self.part_path = self.destination.with_name(self.destination.name + PART_SUFFIX)
+        self.state_path = self.destination.with_name(self.destination.name + STATE_SUFFIX)
+        self.segments = segments
+        self.transport = transport or get_shared_transport()
+        self.on_progress = on_progress or (lambda advance: None)
+        self.on_start = on_start or (lambda total_size: None)
+        self.stop_event = stop_event or threading.Event()
+        self.timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        self.total_size: Optional[int] = None
+        self.probe_latency: Optional[float] = None
+        self.transferred = 0
+        self.state: Dict = {}
+        self._lock = threading.Lock()
+
+    def _get(self, url: str, headers: Dict[str, str]) -> requests.Response:
+        return self.transport.get(url, stream=True, timeout=self.timeout,
+                                  headers={'Accept-Encoding': 'identity', **headers})
+
+    def probe(self) -> Tuple[str, Optional[int], bool, Optional[str]]:
+        started = time.monotonic()
+        with self._get(self.url, {'Range': 'bytes=0-0'}) as r:
+            self.probe_latency = time.monotonic() - started
+            r.raise_for_status()
+            validator = r.headers.get('ETag')
+            if not validator or validator.startswith('W/'):
+                validator = r.headers.get('Last-Modified')
+            match = CONTENT_RANGE_PATTERN.match(r.headers.get('Content-Range', ''))
+            if r.status_code == 206 and match and match.group(3) != '*':
+                return r.url, int(match.group(3)), True, validator
+            length = r.headers.get('Content-Length')
+            return r.url, int(length) if length and length.isdigit() else None, False, validator
+
+    def _load_state(self, url: str, size: int, validator: Optional[str]) -> Optional[Dict]:
+        if not self.part_path.exists(): return None
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if state.get('size') != size or state.get('validator') != validator or state.get('source') != self.url:
+            return None
+        if self.part_path.stat().st_size != size:
+            return None
+        state['url'] = url
+        return state
+
+    def _save_state(self):
+        with self._lock:
+            snapshot = json.dumps(self.state)
+        temp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot)
+        os.replace(temp_path, self.state_path)
+
+    def downloaded_bytes(self) -> int:
+        with self._lock:
+            return sum(segment[2] for segment in self.state.get('segments', []))
+
+    def _read_into(self, response: requests.Response, f, limit: Optional[int]) -> int:
+        chunk_size = DOWNLOAD_CHUNK_MIN
+        received = 0
+        while limit is None or received < limit:
+            if self.stop_event.is_set():
+                raise DownloadCancelled()
+            started = time.monotonic()
+            chunk = response.raw.read(chunk_size if limit is None else min(chunk_size, limit - received))
+            if not chunk:
+                break
+            f.write(chunk)
+            received += len(chunk)
+            with self._lock:
+                self.transferred += len(chunk)
+            yield len(chunk)
+
+            elapsed = time.monotonic() - started
+            if elapsed < 0.1 and chunk_size < DOWNLOAD_CHUNK_MAX:
+                chunk_size *= 2
+            elif elapsed > 1.0 and chunk_size > DOWNLOAD_CHUNK_MIN:
+                chunk_size //= 2
+
+    def _fetch_segment(self, segment: List[int]):
+        failures = 0
+        with open(self.part_path, 'r+b') as f:
+            while segment[0] + segment[2] <= segment[1]:
+                start = segment[0] + segment[2]
+                headers = {'Range': f'bytes={start}-{segment[1]}'}
+                if self.state.get('validator'):
+                    headers['If-Range'] = self.state['validator']
+                try:
+                    with self._get(self.state['url'], headers) as r:
+                        if r.status_code != 206:
+                            raise DownloadError(f"Server tidak melanjutkan segmen (HTTP {r.status_code}).")
+                        f.seek(start)
+                        for advance in self._read_into(r, f, segment[1] - start + 1):
+                            with self._lock:
+                                segment[2] += advance
+                            self.on_progress(advance)
+                            failures = 0
+                except STREAM_ERRORS:
+                    failures += 1
+                    if failures > DOWNLOAD_SEGMENT_RETRIES:
+                        raise
+                    time.sleep(min(HTTP_BACKOFF_MAX, 0.5 * (2 ** failures)))
+
+    def _download_segmented(self, url: str, size: int, validator: Optional[str]):
+        state = self._load_state(url, size, validator)
+        if state is None:
+            state = {'source': self.url, 'url': url, 'size': size, 'validator': validator,
+                     'segments': split_segments(size, self.segments)}
+            with open(self.part_path, 'wb') as f:
+                f.truncate(size)
+        self.state = state
+        self._save_state()
+        if self.downloaded_bytes():
+            self.on_progress(self.downloaded_bytes())
+
+        pending = [segment for segment in state['segments'] if segment[0] + segment[2] <= segment[1]]
+        with ThreadPoolExecutor(max_workers=max(1, len(pending))) as executor:
+            futures = [executor.submit(self._fetch_segment, segment) for segment in pending]
+            try:
+                while True:
+                    done, not_done = wait(futures, timeout=DOWNLOAD_STATE_INTERVAL, return_when=FIRST_EXCEPTION)
+                    self._save_state()
+                    for future in done:
+                        future.result()
+                    if not not_done:
+                        break
+            except BaseException:
+                self.stop_event.set()
+                raise
+            finally:
+                wait(futures)
+                self._save_state()
+
+        actual_size = self.part_path.stat().st_size
+        if self.downloaded_bytes() != size or actual_size != size:
+            raise DownloadError(f"Ukuran file tidak sesuai ({actual_size} dari {size} byte).")
+
+    def _download_single(self, url: str, size: Optional[int]):
+        try:
+            with self._get(url, {}) as r:
+                r.raise_for_status()
+                with open(self.part_path, 'wb') as f:
+                    for advance in self._read_into(r, f, None):
+                        self.on_progress(advance)
+        except BaseException:
+            self.part_path.unlink(missing_ok=True)
+            raise
+        actual_size = self.part_path.stat().st_size
+        if size is not None and actual_size != size:
+            self.part_path.unlink()
+            raise DownloadError(f"Ukuran file tidak sesuai ({actual_size} dari {size} byte).")
+
+    def run(self) -> Path:
+        url, size, accepts_ranges, validator = self.probe()
+        self.total_size = size
+        self.on_start(size)
+        if accepts_ranges and size:
+            self._download_segmented(url, size, validator)
+        else:
+            self.state_path.unlink(missing_ok=True)
+            self._download_single(url, size)
+        os.replace(self.part_path, self.destination)
+        self.state_path.unlink(missing_ok=True)
+        return self.destination
+
+def download_file(url: str, title: str, segments: int = DOWNLOAD_SEGMENTS) -> Optional[Path]:
+    filename = safe_filename(title)
+    destination = EXPORT_DIR / filename
 
     progress = Progress(
         TextColumn("[bold blue]{task.fields[filename]}", justify="right"),
@@ -37,27 +242,26 @@ def download_file(url: str, title: str) -> Optional[Path]:
         transient=True
     )
 
+    task_id = progress.add_task("download", total=None, filename=filename)
+    downloader = SegmentedDownloader(
+        url, destination, segments,
+        on_progress=lambda advance: progress.update(task_id, advance=advance),
+        on_start=lambda total_size: progress.update(task_id, total=total_size),
+    )
     try:
-        with requests.get(url, stream=True, headers=HTTP_HEADERS, timeout=30) as r:
-            r.raise_for_status()
-            total_size = int(r.headers.get('content-length', 0))
-            
-            with progress:
-                task_id = progress.add_task("download", total=total_size, filename=safe_filename)
-                with open(destination, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        progress.update(task_id, advance=len(chunk))
-        
+        with progress:
+            downloader.run()
         console.print(f"[success]✅ Unduhan selesai! File disimpan di:[/success] [info]{destination}[/info]")
         return destination
-    except requests.exceptions.RequestException as e:
+    except (DownloadCancelled, KeyboardInterrupt):
+        downloader.stop_event.set()
+        console.print("[warning]⏸️ Unduhan dihentikan. Jalankan lagi untuk melanjutkan dari posisi terakhir.[/warning]")
+        return None
+    except (requests.exceptions.RequestException, Urllib3HTTPError, DownloadError) as e:
         console.print(f"[error]❌ Gagal mengunduh file: {e}[/error]")
-        if destination.exists():
-            destination.unlink()
+        if downloader.downloaded_bytes():
+            console.print("[info]Progres disimpan, unduhan dapat dilanjutkan nanti.[/info]")
         return None
     except Exception as e:
         console.print(f"[error]❌ Terjadi error tak terduga saat mengunduh: {e}[/error]")
-        if destination.exists():
-            destination.unlink()
         return None
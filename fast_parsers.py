@@ -0,0 +1,81 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import lxml.html
+from lxml.etree import ParserError, _Element
+
+from parsers import build_anime_details, build_download_links, build_episodes_and_batch, build_full_anime_list
+
+def has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def make_tree(html: str) -> Optional[_Element]:
+    if not html or not html.strip(): return None
+    try:
+        return lxml.html.document_fromstring(html)
+    except ParserError:
+        return None
+
+def text_of(element: _Element) -> str:
+    if element.find('.//script') is None and element.find('.//style') is None:
+        return element.text_content()
+    return ''.join(element.xpath('.//text()[not(ancestor::script) and not(ancestor::style)]'))
+
+def _first(tree: _Element, xpath: str) -> Optional[_Element]:
+    found = tree.xpath(xpath)
+    return found[0] if found else None
+
+def _links(element: _Element) -> List[Tuple[str, str]]:
+    return [(text_of(a), a.get('href')) for a in element.xpath('.//a[@href]')]
+
+def parse_full_anime_list(tree: _Element) -> List[Dict[str, str]]:
+    columns = tree.xpath(f"//*[@id='abtext']//*[{has_class('bariskelom')}]")
+    return build_full_anime_list(link for column in columns for link in _links(column))
+
+def extract_episodes_and_batch(tree: _Element) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    sections = []
+    for container in tree.xpath(f"//div[{has_class('episodelist')}]"):
+        title_tag = _first(container, f".//span[{has_class('monktit')}]")
+        sections.append((text_of(title_tag) if title_tag is not None else "", _links(container)))
+    return build_episodes_and_batch(sections, lambda: _links(tree))
+
+def parse_anime_details(tree: _Element) -> Optional[Dict[str, Any]]:
+    info_element = _first(tree, f"//div[{has_class('infozingle')}]")
+    if info_element is None: return None
+
+    title_tag = _first(tree, f"//h1[{has_class('posttl')}]")
+    if title_tag is None:
+        title_tag = _first(tree, "//title")
+    title = text_of(title_tag).strip() if title_tag is not None else "Judul Tidak Ditemukan"
+    sinopsis_element = _first(tree, f"//div[{has_class('sinopc')}]")
+
+    return build_anime_details(
+        title,
+        (text_of(p_tag) for p_tag in info_element.xpath('.//p')),
+        text_of(sinopsis_element) if sinopsis_element is not None else None,
+        extract_episodes_and_batch(tree),
+    )
+
+def parse_download_links(tree: _Element, page_url: str) -> Dict[str, List[Dict[str, str]]]:
+    selector = ' or '.join(has_class(name) for name in ('download', 'dl-box', 'smokeddl', 'batchlink'))
+    download_containers = tree.xpath(f"//*[{selector}]")
+    if not download_containers: return {}
+
+    def anchors(header: _Element) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        link_container = _first(header, "following-sibling::ul[1]")
+        if link_container is None:
+            link_container = header.getparent()
+        if link_container is None: return []
+        return [(text_of(a), a.get('href'), a.get('data-content')) for a in link_container.xpath('.//a[@href]')]
+
+    def groups():
+        for container in download_containers:
+            for header in container.xpath('.//*[self::strong or self::p or self::h4]'):
+                yield text_of(header), lambda header=header: anchors(header)
+
+    return build_download_links(groups(), page_url)
+
+PARSERS: Dict[str, Callable[..., Any]] = {
+    "full_anime_list": parse_full_anime_list,
+    "anime_details": parse_anime_details,
+    "download_links": parse_download_links,
+}
@@ -0,0 +1,269 @@
+"""Mode non-interaktif: hasil dialirkan sebagai NDJSON ke stdout.
+
+Contoh:
+    python main.py search "one piece" "naruto"
+    python main.py details https://otakudesu.cloud/anime/xxx-sub-indo/
+    cat episode_urls.txt | python main.py links --workers 8
+    python main.py list ongoing --pages 3
+    python main.py mirror --workers 4 --rate 4
+    python main.py sync
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
+import scraper as scraper_module
+import utils
+from cache_manager import CacheManager
+from catalog_mirror import CatalogStore, MirrorJob, SyncJob
+from constants import FAVORITES_CHECK_WORKERS, MIRROR_WORKERS, MIRROR_RATE
+from scraper import Scraper
+
+LIST_TYPES = {"ongoing": "ongoing-anime", "complete": "complete-anime"}
+
+class NdjsonWriter:
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+        self.errors = 0
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def error(self, command: str, item: str, message: str):
+        self.errors += 1
+        self.write({"command": command, "input": item, "error": message})
+
+def read_inputs(values: List[str]) -> Iterator[str]:
+    if values and values != ["-"]:
+        yield from values
+        return
+    for line in sys.stdin:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+class HeadlessRunner:
+
+    def __init__(self, writer: NdjsonWriter, workers: int, use_cache: bool = True):
+        self.writer = writer
+        self.workers = workers
+        self.scraper = Scraper()
+        self.cache = CacheManager() if use_cache else None
+        self._broken_pipe = False
+
+    def _emit(self, command: str, item: str, future: Future):
+        try:
+            try:
+                records = future.result()
+            except Exception as e:
+                self.writer.error(command, item, str(e))
+                return
+            if not records:
+                self.writer.error(command, item, "tidak ada hasil")
+            for record in records:
+                self.writer.write(record)
+        except BrokenPipeError:
+            self._broken_pipe = True
+
+    def run_many(self, command: str, items: Iterable[str], handle: Callable[[str], Optional[Iterable[Dict[str, Any]]]]):
+        slots = threading.BoundedSemaphore(max(1, self.workers) * 2)
+        seen = set()
+
+        def finish(item: str, future: Future):
+            try:
+                self._emit(command, item, future)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as executor:
+            for item in items:
+                if self._broken_pipe:
+                    break
+                if item in seen:
+                    continue
+                seen.add(item)
+                slots.acquire()
+                future = executor.submit(lambda item=item: list(handle(item) or []))
+                future.add_done_callback(lambda future, item=item: finish(item, future))
+        if self._broken_pipe:
+            raise BrokenPipeError
+
+    def _details(self, url: str) -> Optional[Dict[str, Any]]:
+        details = self.cache.get_anime_details(url) if self.cache and not self.cache.is_anime_details_stale(url) else None
+        if details is None:
+            details = self.scraper.get_anime_details(url)
+            if details and self.cache:
+                self.cache.set_anime_details(url, details)
+        return details
+
+    def _links(self, url: str) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        links = self.cache.get_download_links(url) if self.cache else None
+        if links is None:
+            links = self.scraper.get_download_links(url)
+            if links and self.cache:
+                self.cache.set_many_download_links({url: links})
+        return links
+
+    def search(self, query: str):
+        for result in self.scraper.search_anime(query) or []:
+            yield {"query": query, **result}
+
+    def details(self, url: str):
+        details = self._details(url)
+        if details:
+            yield {"url": url, **details}
+
+    def episodes(self, url: str):
+        details = self._details(url) or {}
+        for number, episode in enumerate(details.get('episodes', []), 1):
+            yield {"anime_url": url, "number": number, **episode}
+        for batch in details.get('batch_links', []):
+            yield {"anime_url": url, "batch": True, **batch}
+
+    def links(self, url: str):
+        for resolution, link_list in (self._links(url) or {}).items():
+            for link in link_list:
+                yield {"episode_url": url, "resolution": resolution, **link}
+
+    def genre(self, slug: str):
+        for anime in self.scraper.get_all_anime_from_genre(slug.strip('/').split('/')[-1]) or []:
+            yield {"genre": slug, **anime}
+
+    def list_pages(self, list_type: str, pages: int):
+        if list_type == "full":
+            full_list = self.scraper.get_full_anime_list()
+            if not full_list:
+                self.writer.error("list", "full", "gagal mengambil daftar anime lengkap")
+            for anime in full_list or []:
+                self.writer.write({"list": "full", **anime})
+            return
+
+        def fetch(page: int):
+            anime_list, _ = self.scraper.get_anime_list(LIST_TYPES[list_type], page)
+            return [{"list": list_type, "page": page, **anime} for anime in anime_list or []]
+
+        self.run_many("list", range(1, pages + 1), fetch)
+
+    def mirror(self, rate: float, limit: Optional[int], sync: bool = False):
+        command = "sync" if sync else "mirror"
+        progress = Progress(
+            TextColumn(f"[bold blue]{'Sinkronisasi' if sync else 'Mirror'} katalog"),
+            BarColumn(bar_width=None),
+            MofNCompleteColumn(),
+            TextColumn("• {task.fields[rate]:.2f} hlm/dtk • ETA {task.fields[eta]} • gagal {task.fields[failed]}"),
+            console=Console(stderr=True),
+        )
+        task_id = progress.add_task("mirror", total=None, rate=0.0, eta="-", failed=0)
+
+        def on_progress(stats: Dict[str, Any]):
+            eta = stats["eta_seconds"]
+            progress.update(
+                task_id, total=stats["total"], completed=stats["fetched"] + stats["failed"], rate=stats["pages_per_sec"],
+                eta=time.strftime('%H:%M:%S', time.gmtime(eta)) if eta is not None else "-", failed=stats["failed"],
+            )
+
+        store = CatalogStore()
+        try:
+            job = (SyncJob if sync else MirrorJob)(self.scraper, store, self.workers, rate, on_progress)
+            if job.rate < rate:
+                print(f"Peringatan: --rate {rate:g} melebihi batas penjadwal host, dipakai {job.rate:g} permintaan/detik.",
+                      file=sys.stderr)
+            with progress:
+                stats = job.run(limit)
+            if stats is None:
+                self.writer.error(command, "feed" if sync else "anime-list", "gagal mengambil daftar anime")
+                return
+            self.writer.write({"command": command, "stored": store.count(), "failures": store.failure_count(), **stats})
+        finally:
+            store.close()
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--workers", type=int, default=FAVORITES_CHECK_WORKERS, help="Jumlah permintaan paralel.")
+    common.add_argument("--no-cache", action="store_true", help="Selalu ambil dari situs, abaikan cache lokal.")
+
+    parser = argparse.ArgumentParser(prog="otakudesu", description="Scraper Otakudesu tanpa antarmuka interaktif (keluaran NDJSON).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text, metavar in (
+        ("search", "Cari anime berdasarkan judul.", "QUERY"),
+        ("details", "Detail anime dari URL halaman anime.", "URL"),
+        ("episodes", "Daftar episode dari URL halaman anime.", "URL"),
+        ("links", "Link unduhan dari URL halaman episode/batch.", "URL"),
+        ("genre", "Semua anime dalam genre (slug atau URL). Tanpa argumen: daftar genre, '-': baca dari stdin.", "GENRE"),
+    ):
+        command = commands.add_parser(name, help=help_text, parents=[common])
+        command.add_argument("inputs", nargs="*", metavar=metavar, help="Kosongkan atau '-' untuk membaca dari stdin.")
+
+    commands.add_parser("schedule", help="Jadwal rilis mingguan.", parents=[common])
+    list_command = commands.add_parser("list", help="Daftar anime ongoing/complete per halaman, atau seluruh daftar A-Z.", parents=[common])
+    list_command.add_argument("type", choices=[*LIST_TYPES, "full"])
+    list_command.add_argument("--pages", type=int, default=1, help="Jumlah halaman yang diambil (ongoing/complete).")
+
+    mirror_command = commands.add_parser("mirror", help="Salin detail seluruh katalog ke data/catalog.db (bisa dilanjutkan).", parents=[common])
+    mirror_command.add_argument("--rate", type=float, default=MIRROR_RATE,
+                                help="Batas atas permintaan per detik (tetap dibatasi penjadwal per host).")
+    mirror_command.add_argument("--limit", type=int, help="Ambil paling banyak N judul pada proses ini.")
+    mirror_command.set_defaults(workers=MIRROR_WORKERS)
+
+    sync_command = commands.add_parser("sync", help="Perbarui catalog.db hanya untuk judul ongoing yang berubah.", parents=[common])
+    sync_command.add_argument("--rate", type=float, default=MIRROR_RATE,
+                              help="Batas atas permintaan per detik (tetap dibatasi penjadwal per host).")
+    sync_command.add_argument("--limit", type=int, help="Ambil paling banyak N judul pada proses ini.")
+    sync_command.set_defaults(workers=MIRROR_WORKERS)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    for console in (scraper_module.console, utils.console):
+        console.file = sys.stderr
+
+    writer = NdjsonWriter()
+    runner = HeadlessRunner(writer, args.workers, use_cache=not args.no_cache)
+    try:
+        if args.command == "schedule":
+            schedule = runner.scraper.get_release_schedule()
+            if not schedule:
+                writer.error("schedule", "jadwal-rilis", "gagal mengambil jadwal rilis")
+            for day, anime_list in (schedule or {}).items():
+                for anime in anime_list:
+                    writer.write({"day": day, **anime})
+        elif args.command == "list":
+            runner.list_pages(args.type, args.pages)
+        elif args.command in ("mirror", "sync"):
+            runner.mirror(args.rate, args.limit, sync=args.command == "sync")
+        elif args.command == "genre" and not args.inputs:
+            genres = runner.scraper.get_genre_list()
+            if not genres:
+                writer.error("genre", "genre-list", "gagal mengambil daftar genre")
+            for genre in genres or []:
+                writer.write(genre)
+        else:
+            handlers = {
+                "search": runner.search, "details": runner.details, "episodes": runner.episodes,
+                "links": runner.links, "genre": runner.genre,
+            }
+            runner.run_many(args.command, read_inputs(args.inputs), handlers[args.command])
+    except BrokenPipeError:
+        return 0
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if runner.cache:
+            runner.cache.close()
+    return 1 if writer.errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
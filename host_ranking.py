@@ -0,0 +1,58 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from cache_manager import CacheManager
+from constants import (HOST_STATS_SMOOTHING, HOST_DEFAULT_LATENCY, HOST_DEFAULT_SPEED,
+                       HOST_RANK_REFERENCE_BYTES)
+
+class HostRanker:
+
+    def __init__(self, cache: CacheManager):
+        self.cache = cache
+        self._stats: Dict[str, Dict[str, Any]] = cache.get_host_stats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(host: str) -> str:
+        return host.strip().lower()
+
+    def record(self, host: str, ok: bool, latency: Optional[float] = None, speed: Optional[float] = None):
+        key = self._key(host)
+        with self._lock:
+            stats = self._stats.setdefault(key, {"successes": 0, "failures": 0, "latency": None, "speed": None})
+            stats["successes" if ok else "failures"] += 1
+            for field, value in (("latency", latency), ("speed", speed)):
+                if value is not None:
+                    previous = stats[field]
+                    stats[field] = value if previous is None else previous + HOST_STATS_SMOOTHING * (value - previous)
+            stats["updated_at"] = time.time()
+            snapshot = dict(stats)
+        self.cache.set_host_stats(key, snapshot)
+
+    def success_rate(self, host: str) -> float:
+        stats = self._stats.get(self._key(host))
+        if not stats: return 0.5
+        return (stats["successes"] + 1) / (stats["successes"] + stats["failures"] + 2)
+
+    def expected_cost(self, host: str) -> float:
+        stats = self._stats.get(self._key(host)) or {}
+        latency = stats.get("latency") or HOST_DEFAULT_LATENCY
+        speed = stats.get("speed") or HOST_DEFAULT_SPEED
+        return (latency + HOST_RANK_REFERENCE_BYTES / speed) / self.success_rate(host)
+
+    def rank(self, links: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        return sorted(links, key=lambda link: self.expected_cost(link['host']))
+
+    def rank_all(self, links: Dict[str, List[Dict[str, str]]]) -> Dict[str, List[Dict[str, str]]]:
+        return {resolution: self.rank(link_list) for resolution, link_list in links.items()}
+
+    def describe(self, host: str) -> Optional[str]:
+        stats = self._stats.get(self._key(host))
+        if not stats: return None
+        parts = [f"{self.success_rate(host) * 100:.0f}% sukses"]
+        if stats.get("latency") is not None:
+            parts.append(f"{stats['latency']:.1f} dtk")
+        if stats.get("speed"):
+            parts.append(f"{stats['speed'] / (1024 * 1024):.1f} MB/dtk")
+        return " • ".join(parts)
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+
+from constants import (HTTP_CACHE_DIR, HTTP_CACHE_TTL, HTTP_CACHE_MAX_ENTRIES,
+                       HTTP_CACHE_MAX_BYTES, HTTP_CACHE_PRUNE_EVERY)
+
+class HttpResponseStore:
+
+    def __init__(self, directory: Path = HTTP_CACHE_DIR, ttl: float = HTTP_CACHE_TTL,
+                 max_entries: int = HTTP_CACHE_MAX_ENTRIES, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._puts = 0
+        self._lock = threading.Lock()
+        self.prune()
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, str]]:
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+        return entry if entry.get('url') == url else None
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, str]]) -> Dict[str, str]:
+        headers = {}
+        if not entry:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url: str, response: requests.Response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        path = self._path(url)
+        if not etag and not last_modified:
+            path.unlink(missing_ok=True)
+            return
+
+        entry = {"url": url, "etag": etag, "last_modified": last_modified, "body": response.text}
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            with self._lock:
+                os.replace(tmp_path, path)
+                self._puts += 1
+                prune = self._puts % HTTP_CACHE_PRUNE_EVERY == 0
+        except IOError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        if prune:
+            self.prune()
+
+    def touch(self, url: str):
+        try:
+            os.utime(self._path(url))
+        except OSError:
+            pass
+
+    def prune(self):
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.ttl:
+                Path(entry.path).unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        entries.sort()
+        count, total_bytes = len(entries), sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            Path(path).unlink(missing_ok=True)
+            count -= 1
+            total_bytes -= size
+
+    def count(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.json"))
+
+    def size_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.directory.glob("*.json"))
+
+    def clear(self):
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
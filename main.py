@@ -1,10 +1,16 @@
-from cli import OtakuCLI
+import sys
+
 from constants import DATA_DIR, EXPORT_DIR
 
 def main():
     DATA_DIR.mkdir(exist_ok=True)
     EXPORT_DIR.mkdir(exist_ok=True)
 
+    if len(sys.argv) > 1:
+        from headless import main as headless_main
+        sys.exit(headless_main(sys.argv[1:]))
+
+    from cli import OtakuCLI
     app = OtakuCLI()
     app.run()
 
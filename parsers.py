@@ -0,0 +1,302 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from constants import BASE_URL, PARSER_BACKEND
+from utils import decode_base64_url
+
+def make_soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "lxml")
+
+def search_url(query: str) -> str:
+    return f"{BASE_URL}/?s={query}&post_type=anime"
+
+def anime_list_url(list_type: str, page: int = 1) -> str:
+    return urljoin(BASE_URL, f"{list_type}/page/{page}/")
+
+def full_anime_list_url() -> str:
+    return f"{BASE_URL}/anime-list/"
+
+def release_schedule_url() -> str:
+    return f"{BASE_URL}/jadwal-rilis/"
+
+def genre_list_url() -> str:
+    return f"{BASE_URL}/genre-list/"
+
+def parse_search_results(soup: BeautifulSoup) -> List[Dict[str, str]]:
+    results = []
+    search_container = soup.find('ul', class_='chivsrc')
+    if not search_container: return []
+    for item in search_container.find_all('li'):
+        link_tag, title_tag = item.find('a'), item.find('h2')
+        if link_tag and title_tag:
+            results.append({"title": title_tag.text.strip(), "url": link_tag['href']})
+    return results
+
+def parse_anime_list(soup: BeautifulSoup) -> Tuple[List[Dict[str, str]], bool]:
+    anime_list = []
+    container = soup.find('div', class_='venz')
+    if not container:
+        container = soup.find('div', class_='venser')
+
+    if not container: return [], False
+
+    items = container.find_all('li')
+    if not items:
+        items = container.find_all('div', class_='col-anime')
+
+    for item in items:
+        title_tag = item.find('h2') or item.find(class_='col-anime-title')
+        link_tag = item.find('a')
+        if title_tag and link_tag:
+            actual_link = title_tag.find('a') or link_tag
+            entry = {"title": actual_link.text.strip(), "url": actual_link['href']}
+            episode_tag = item.find(class_='epz')
+            if episode_tag:
+                entry["episode"] = episode_tag.text.strip()
+            anime_list.append(entry)
+
+    pagination = soup.find('div', class_='pagination')
+    has_next_page = pagination.find('a', class_='next') is not None if pagination else False
+    return anime_list, has_next_page
+
+def extract_last_page(soup: BeautifulSoup) -> int:
+    pagination = soup.find('div', class_='pagination')
+    if not pagination: return 1
+    pages = [1]
+    for tag in pagination.find_all(['a', 'span']):
+        text = tag.text.strip().replace('.', '').replace(',', '')
+        if text.isdigit():
+            pages.append(int(text))
+        match = re.search(r'/page/(\d+)', tag.get('href', ''))
+        if match:
+            pages.append(int(match.group(1)))
+    return max(pages)
+
+def build_full_anime_list(links: Iterable[Tuple[str, str]]) -> List[Dict[str, str]]:
+    anime_list = [{"title": text.strip(), "url": href} for text, href in links]
+    return sorted(anime_list, key=lambda x: x['title'])
+
+def parse_full_anime_list(soup: BeautifulSoup) -> List[Dict[str, str]]:
+    columns = soup.select('#abtext .bariskelom')
+    return build_full_anime_list(
+        (link.text, link['href']) for column in columns for link in column.find_all('a', href=True)
+    )
+
+def parse_release_schedule(soup: BeautifulSoup) -> Optional[Dict[str, List[Dict[str, str]]]]:
+    schedule = {}
+    schedule_container = soup.find('div', class_='kgjdwl321')
+    if not schedule_container: return None
+
+    day_containers = schedule_container.find_all('div', class_='kglist321')
+    for day_container in day_containers:
+        day_name_tag = day_container.find('h2')
+        if not day_name_tag: continue
+
+        day_name = day_name_tag.text.strip()
+        anime_list = []
+
+        anime_ul = day_container.find('ul')
+        if anime_ul:
+            for anime_item in anime_ul.find_all('li'):
+                link_tag = anime_item.find('a')
+                if link_tag:
+                    anime_list.append({
+                        "title": link_tag.text.strip(),
+                        "url": link_tag['href']
+                    })
+        schedule[day_name] = anime_list
+    return schedule
+
+def parse_genre_list(soup: BeautifulSoup) -> List[Dict[str, str]]:
+    genres = []
+    genre_container = soup.find('ul', class_='genres')
+    if not genre_container:
+        genre_container = soup.find('div', id='genrez')
+    if not genre_container:
+        genre_container = soup.find('div', class_='genre-list')
+
+    if genre_container:
+        for genre_link in genre_container.find_all('a'):
+            genres.append({
+                "name": genre_link.text.strip(),
+                "url": genre_link['href']
+            })
+    return sorted(genres, key=lambda x: x['name'])
+
+EPISODE_NUMBER_PATTERN = re.compile(r'Episode\s+(\d+(?:[.,]\d+)?)', re.I)
+SPECIAL_PATTERN = re.compile(r'\b(?:OVA|OAD|ONA|Special|Spesial|SP|Movie)\b', re.I)
+NUMBER_PATTERN = re.compile(r'(\d+(?:[.,]\d+)?)')
+DIGITS_SPLIT_PATTERN = re.compile(r'(\d+)')
+BATCH_PATTERN = re.compile(r'batch', re.I)
+
+ABSOLUTE_HREF_PATTERN = re.compile(r'https?://[^\s;?#]+')
+ROOT_RELATIVE_HREF_PATTERN = re.compile(r'/[^\s;?#]*')
+BASE_ORIGIN = "{0.scheme}://{0.netloc}".format(urlparse(BASE_URL))
+
+@lru_cache(maxsize=8192)
+def absolute_url(href: str) -> str:
+    if ABSOLUTE_HREF_PATTERN.fullmatch(href):
+        return href
+    if ROOT_RELATIVE_HREF_PATTERN.fullmatch(href) and '//' not in href and '/.' not in href:
+        return BASE_ORIGIN + href
+    return urljoin(BASE_URL, href)
+
+def natural_key(text: str) -> Tuple:
+    parts = DIGITS_SPLIT_PATTERN.split(text.lower())
+    return tuple(int(part) if i % 2 else part for i, part in enumerate(parts))
+
+def episode_sort_key(title: str) -> Tuple:
+    match = EPISODE_NUMBER_PATTERN.search(title)
+    if match and not SPECIAL_PATTERN.search(title):
+        return (0, float(match.group(1).replace(',', '.')), title)
+    if match or SPECIAL_PATTERN.search(title):
+        number = NUMBER_PATTERN.search(title)
+        return (1, float(number.group(1).replace(',', '.')) if number else float('inf'), natural_key(title))
+    return (2, 0.0, natural_key(title))
+
+def latest_episode_number(episodes: Iterable[Dict[str, str]]) -> Optional[float]:
+    numbers = [key[1] for key in (episode_sort_key(episode['title']) for episode in episodes) if key[0] == 0]
+    return max(numbers) if numbers else None
+
+def build_episodes_and_batch(sections: List[Tuple[str, List[Tuple[str, str]]]],
+                             fallback_links: Callable[[], List[Tuple[str, str]]]) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    episodes: Dict[str, Dict[str, str]] = {}
+    batch_links: Dict[str, Dict[str, str]] = {}
+
+    for title, links in sections:
+        title = title.lower()
+        if 'batch' in title:
+            target = batch_links
+        elif 'episode list' in title:
+            target = episodes
+        else:
+            continue
+        for text, href in links:
+            url = absolute_url(href)
+            target.setdefault(url, {"title": text.strip(), "url": url})
+
+    if not episodes and not batch_links:
+        for link_text, link_href in fallback_links():
+            href = absolute_url(link_href)
+            text = link_text.strip()
+            is_episode = '/episode/' in href
+            if (BATCH_PATTERN.search(href) or BATCH_PATTERN.search(text)) and (not is_episode or 'batch' in href):
+                batch_links.setdefault(href, {"title": text, "url": href})
+            elif is_episode and href not in batch_links:
+                episodes.setdefault(href, {"title": text, "url": href})
+
+    unique_episodes = sorted(episodes.values(), key=lambda x: episode_sort_key(x['title']))
+    return unique_episodes, list(batch_links.values())
+
+def extract_episodes_and_batch(soup: BeautifulSoup) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    sections = []
+    for container in soup.find_all('div', class_='episodelist'):
+        title_tag = container.find('span', class_='monktit')
+        links = [(link.text, link['href']) for link in container.find_all('a', href=True)]
+        sections.append((title_tag.text if title_tag else "", links))
+    return build_episodes_and_batch(
+        sections, lambda: [(link.text, link['href']) for link in soup.find_all('a', href=True)]
+    )
+
+def build_anime_details(title: str, info_lines: Iterable[str], sinopsis: Optional[str],
+                        episodes_and_batch: Tuple[List[Dict[str, str]], List[Dict[str, str]]]) -> Dict[str, Any]:
+    details: Dict[str, Any] = {'title': title}
+    for line in info_lines:
+        if ':' in line:
+            key, value = line.split(':', 1)
+            details[key.strip().lower().replace(" ", "_")] = value.strip()
+
+    details['sinopsis'] = sinopsis.strip() if sinopsis is not None else "Tidak ditemukan."
+    details['episodes'], details['batch_links'] = episodes_and_batch
+    return details
+
+def parse_anime_details(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    info_element = soup.find('div', class_='infozingle')
+    if not info_element: return None
+
+    title_tag = soup.find('h1', class_='posttl')
+    title = title_tag.text.strip() if title_tag else (soup.find('title').text.strip() if soup.find('title') else "Judul Tidak Ditemukan")
+    sinopsis_element = soup.find('div', class_='sinopc')
+
+    return build_anime_details(
+        title,
+        (p_tag.text for p_tag in info_element.find_all('p')),
+        sinopsis_element.text if sinopsis_element else None,
+        extract_episodes_and_batch(soup),
+    )
+
+def build_download_links(groups: Iterable[Tuple[str, Callable[[], List[Tuple[str, Optional[str], Optional[str]]]]]],
+                         page_url: str) -> Dict[str, List[Dict[str, str]]]:
+    download_links: Dict[str, List[Dict[str, str]]] = {}
+    for resolution_text, anchors in groups:
+        resolution_text = resolution_text.strip()
+        if not re.search(r'\d{3,4}p|mkv|mp4|batch', resolution_text, re.I):
+            continue
+
+        links = []
+        for host, url, data_content in anchors():
+            host = host.strip()
+            if data_content is not None:
+                url = decode_base64_url(data_content)
+            if url and url != '#':
+                links.append({"host": host, "url": url})
+
+        if links:
+            clean_resolution = re.sub(r'\[.*?\]|Subtitle Indonesia', '', resolution_text).strip()
+            if not clean_resolution:
+                clean_resolution = "Unduhan Batch" if 'batch' in page_url else "Unduhan Lainnya"
+
+            if clean_resolution in download_links:
+                download_links[clean_resolution].extend(links)
+            else:
+                download_links[clean_resolution] = links
+
+    return {k: v for k, v in download_links.items() if v}
+
+def parse_download_links(soup: BeautifulSoup, page_url: str) -> Dict[str, List[Dict[str, str]]]:
+    download_containers = soup.select('.download, .dl-box, .smokeddl, .batchlink')
+    if not download_containers: return {}
+
+    def groups():
+        for container in download_containers:
+            for header in container.find_all(['strong', 'p', 'h4']):
+                yield header.text, lambda header=header: anchors(header)
+
+    def anchors(header):
+        link_container = header.find_next_sibling('ul') or header.parent
+        if not link_container: return []
+        return [
+            (a_tag.text, a_tag.get('href'), a_tag.attrs.get('data-content'))
+            for a_tag in link_container.find_all('a', href=True)
+        ]
+
+    return build_download_links(groups(), page_url)
+
+SOUP_PARSERS: Dict[str, Callable[..., Any]] = {
+    "search_results": parse_search_results,
+    "anime_list": parse_anime_list,
+    "last_page": extract_last_page,
+    "full_anime_list": parse_full_anime_list,
+    "release_schedule": parse_release_schedule,
+    "genre_list": parse_genre_list,
+    "anime_details": parse_anime_details,
+    "download_links": parse_download_links,
+}
+
+def parse_html(kind: str, html: str, *args, backend: Optional[str] = None) -> Any:
+    backend = backend or PARSER_BACKEND
+    if backend == "lxml":
+        import fast_parsers
+        if kind in fast_parsers.PARSERS:
+            tree = fast_parsers.make_tree(html)
+            if tree is not None:
+                return fast_parsers.PARSERS[kind](tree, *args)
+    soup = make_soup(html)
+    try:
+        return SOUP_PARSERS[kind](soup, *args)
+    finally:
+        soup.decompose()
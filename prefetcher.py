@@ -0,0 +1,53 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from constants import PREFETCH_WORKERS, PREFETCH_MAX_PENDING
+
+class Prefetcher:
+
+    def __init__(self, max_workers: int = PREFETCH_WORKERS, max_pending: int = PREFETCH_MAX_PENDING):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self.max_pending = max_pending
+        self._futures: Dict[Tuple[str, Hashable], Future] = {}
+        self._cancelled: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, scope: str, key: Hashable, fetch: Callable[[], Any]) -> bool:
+        with self._lock:
+            if (scope, key) in self._futures:
+                return False
+            pending = sum(1 for future in self._futures.values() if not future.done())
+            if pending >= self.max_pending:
+                return False
+            cancelled = self._cancelled.setdefault(scope, threading.Event())
+
+            def task():
+                if cancelled.is_set(): return None
+                return fetch()
+
+            self._futures[(scope, key)] = self._executor.submit(task)
+            return True
+
+    def take(self, scope: str, key: Hashable, timeout: Optional[float] = None) -> Any:
+        with self._lock:
+            future = self._futures.pop((scope, key), None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            return None
+
+    def cancel(self, scope: str):
+        with self._lock:
+            self._cancelled.pop(scope, threading.Event()).set()
+            for future_key in [future_key for future_key in self._futures if future_key[0] == scope]:
+                self._futures.pop(future_key).cancel()
+
+    def shutdown(self):
+        with self._lock:
+            for event in self._cancelled.values():
+                event.set()
+            self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
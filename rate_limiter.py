@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from constants import (SCHEDULER_DEFAULT_RATE, SCHEDULER_DEFAULT_BURST, SCHEDULER_HOST_LIMITS,
+                       SCHEDULER_MIN_RATE, SCHEDULER_BACKOFF_FACTOR, SCHEDULER_RECOVERY_STEP,
+                       SCHEDULER_MAX_WAIT_STEP)
+
+class RateLimiter:
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+class TokenBucket:
+
+    def __init__(self, rate: float, burst: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max(1.0, float(burst))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.waiting = 0
+        self.throttled = 0
+        self.cooldown_until = 0.0
+
+    def refill(self, now: float):
+        capacity = max(1.0, self.burst * self.rate / self.base_rate)
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+class HostScheduler:
+
+    def __init__(self, default_rate: float = SCHEDULER_DEFAULT_RATE, default_burst: float = SCHEDULER_DEFAULT_BURST,
+                 limits: Optional[Dict[str, Tuple[float, float]]] = None, min_rate: float = SCHEDULER_MIN_RATE):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.limits = dict(SCHEDULER_HOST_LIMITS if limits is None else limits)
+        self.min_rate = min_rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def host_rate(self, host: str) -> float:
+        return self.limits.get(host, (self.default_rate, self.default_burst))[0]
+
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            rate, burst = self.limits.get(host, (self.default_rate, self.default_burst))
+            self._buckets[host] = TokenBucket(rate, burst)
+        return self._buckets[host]
+
+    def _try_take(self, host: str, waiting: bool) -> float:
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.refill(time.monotonic())
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                if waiting:
+                    bucket.waiting -= 1
+                return 0.0
+            if not waiting:
+                bucket.waiting += 1
+            return min((1 - bucket.tokens) / bucket.rate, SCHEDULER_MAX_WAIT_STEP)
+
+    def _stop_waiting(self, host: str):
+        with self._lock:
+            self._bucket(host).waiting -= 1
+
+    def acquire(self, host: str):
+        delay = self._try_take(host, waiting=False)
+        try:
+            while delay:
+                time.sleep(delay)
+                delay = self._try_take(host, waiting=True)
+        except BaseException:
+            self._stop_waiting(host)
+            raise
+
+    async def acquire_async(self, host: str):
+        delay = self._try_take(host, waiting=False)
+        try:
+            while delay:
+                await asyncio.sleep(delay)
+                delay = self._try_take(host, waiting=True)
+        except BaseException:
+            self._stop_waiting(host)
+            raise
+
+    def penalize(self, host: str, pause: float = 0.0):
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            bucket.refill(now)
+            bucket.throttled += 1
+            if now >= bucket.cooldown_until:
+                bucket.rate = max(self.min_rate, bucket.rate * SCHEDULER_BACKOFF_FACTOR)
+                bucket.cooldown_until = now + max(pause, 1.0 / bucket.rate)
+            bucket.tokens = min(bucket.tokens, -pause * bucket.rate)
+
+    def reward(self, host: str):
+        with self._lock:
+            bucket = self._bucket(host)
+            if bucket.rate < bucket.base_rate:
+                bucket.refill(time.monotonic())
+                bucket.rate = min(bucket.base_rate, bucket.rate + bucket.base_rate * SCHEDULER_RECOVERY_STEP)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            now = time.monotonic()
+            state = {}
+            for host, bucket in self._buckets.items():
+                bucket.refill(now)
+                state[host] = {
+                    "tokens": round(bucket.tokens, 2), "burst": bucket.burst, "rate": round(bucket.rate, 3),
+                    "base_rate": bucket.base_rate, "waiting": bucket.waiting, "throttled": bucket.throttled,
+                }
+            return state
+
+_shared_scheduler: Optional[HostScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+def get_shared_scheduler() -> HostScheduler:
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = HostScheduler()
+        return _shared_scheduler
@@ -0,0 +1,83 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+from constants import RESULT_CACHE_MAX_BYTES, RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_TTL
+
+MISSING = object()
+
+def estimate_size(value: Any) -> int:
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
+class ResultCache:
+
+    def __init__(self, max_bytes: int = RESULT_CACHE_MAX_BYTES, max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+                 ttl: float = RESULT_CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.bytes = 0
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        self._entries: 'OrderedDict[Hashable, Tuple[float, int, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                self.stats["expired"] += 1
+                entry = None
+            if entry is None:
+                self.stats["misses"] += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[2]
+
+    def put(self, key: Hashable, value: Any):
+        size = estimate_size(value)
+        if size > self.max_bytes or self.ttl <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self.bytes += size
+            while self._entries and (self.bytes > self.max_bytes or len(self._entries) > self.max_entries):
+                self._remove(next(iter(self._entries)))
+                self.stats["evictions"] += 1
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries), "bytes": self.bytes, "max_bytes": self.max_bytes}
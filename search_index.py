@@ -0,0 +1,133 @@
+import bisect
+import difflib
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+FIELD_WEIGHTS = {
+    "title": 10.0,
+    "alt_title": 6.0,
+    "genre": 3.0,
+    "sinopsis": 1.0,
+}
+PREFIX_FACTOR = 0.6
+FUZZY_FACTOR = 0.4
+PHRASE_BONUS = 20.0
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text or '')
+    return ''.join(c for c in text if not unicodedata.combining(c)).lower()
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(normalize(text))
+
+class SearchIndex:
+
+    def __init__(self):
+        self._documents: Dict[str, Dict[str, str]] = {}
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._url_tokens: Dict[str, Set[str]] = {}
+        self._sorted_tokens: Optional[List[str]] = None
+
+    @classmethod
+    def build(cls, anime_list: Iterable[Dict[str, str]], details_by_url: Dict[str, Dict[str, Any]]) -> 'SearchIndex':
+        index = cls()
+        for url, details in details_by_url.items():
+            index.add_details(url, details)
+        for anime in anime_list:
+            index.add(anime['url'], anime['title'])
+        return index
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, url: str, title: str, alt_titles: Iterable[str] = (), genres: str = "", sinopsis: str = ""):
+        if url in self._documents:
+            if not alt_titles and not genres and not sinopsis:
+                return
+            self._remove_postings(url)
+        self._documents[url] = {"title": title, "url": url, "_title_norm": ' '.join(tokenize(title))}
+
+        fields = [("title", title), ("genre", genres), ("sinopsis", sinopsis)]
+        fields.extend(("alt_title", alt) for alt in alt_titles if alt)
+        url_tokens = self._url_tokens[url] = set()
+        for field, text in fields:
+            weight = FIELD_WEIGHTS[field]
+            for token in set(tokenize(text)):
+                postings = self._postings[token]
+                postings[url] = max(postings.get(url, 0.0), weight)
+                url_tokens.add(token)
+        self._sorted_tokens = None
+
+    def add_details(self, url: str, details: Dict[str, Any]):
+        self.add(
+            url,
+            details.get('title', ''),
+            alt_titles=[details.get('judul', ''), details.get('japanese', '')],
+            genres=details.get('genre', ''),
+            sinopsis=details.get('sinopsis', ''),
+        )
+
+    def _remove_postings(self, url: str):
+        for token in self._url_tokens.pop(url, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(url, None)
+            if not postings:
+                del self._postings[token]
+
+    def _tokens(self) -> List[str]:
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        return self._sorted_tokens
+
+    def _expand(self, term: str) -> Dict[str, float]:
+        if term in self._postings:
+            return {term: 1.0}
+
+        tokens = self._tokens()
+        expansions: Dict[str, float] = {}
+        start = bisect.bisect_left(tokens, term)
+        for token in tokens[start:]:
+            if not token.startswith(term):
+                break
+            expansions[token] = PREFIX_FACTOR
+        if expansions or len(term) < 3:
+            return expansions
+
+        for token in difflib.get_close_matches(term, tokens, n=5, cutoff=0.75):
+            expansions[token] = FUZZY_FACTOR
+        return expansions
+
+    def search(self, query: str, limit: int = 50, titles_only: bool = False) -> List[Dict[str, str]]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores: Dict[str, float] = defaultdict(float)
+        matched_terms: Dict[str, Set[str]] = defaultdict(set)
+        for term in terms:
+            for token, factor in self._expand(term).items():
+                if titles_only and factor == FUZZY_FACTOR:
+                    continue
+                for url, weight in self._postings[token].items():
+                    if titles_only and weight < FIELD_WEIGHTS["alt_title"]:
+                        continue
+                    scores[url] += weight * factor
+                    matched_terms[url].add(term)
+
+        phrase = ' '.join(terms)
+        required = len(set(terms))
+        ranked = []
+        for url, score in scores.items():
+            if len(matched_terms[url]) < required:
+                continue
+            if phrase in self._documents[url]['_title_norm']:
+                score += PHRASE_BONUS
+            ranked.append((-score, self._documents[url]['title'], url))
+        ranked.sort()
+        return [{"title": title, "url": url} for _, title, url in ranked[:limit]]
@@ -0,0 +1,51 @@
+import csv
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cache_manager import CacheManager
+from constants import EXPORT_DIR
+from host_ranking import HostRanker
+from scraper import Scraper
+
+def links_by_host(links: Dict[str, List[Dict[str, str]]]) -> Dict[str, Dict[str, str]]:
+    mapping: Dict[str, Dict[str, str]] = {}
+    for resolution, link_list in links.items():
+        hosts = mapping.setdefault(resolution, {})
+        for link in link_list:
+            hosts.setdefault(link['host'], link['url'])
+    return mapping
+
+def resolve_season(scraper: Scraper, cache: CacheManager, episodes: List[Dict[str, str]],
+                   refresh: bool = False, ranker: Optional[HostRanker] = None) -> Dict[str, Dict[str, Any]]:
+    urls = [ep['url'] for ep in episodes]
+    links = {} if refresh else cache.get_many_download_links(urls)
+    missing = [url for url in urls if url not in links]
+    if missing:
+        fetched = {url: result for url, result in scraper.get_many_download_links(missing).items() if result}
+        cache.set_many_download_links(fetched)
+        links.update(fetched)
+
+    rank = ranker.rank_all if ranker else (lambda episode_links: episode_links)
+    return {
+        ep['url']: {"title": ep['title'], "links": links_by_host(rank(links.get(ep['url'], {})))}
+        for ep in episodes
+    }
+
+def export_season_links(season: Dict[str, Dict[str, Any]], anime_title: str, file_format: str = "json") -> Path:
+    slug = re.sub(r'[^a-z0-9]+', '_', anime_title.lower()).strip('_') or "anime"
+    filepath = EXPORT_DIR / f"season_{slug}_{int(time.time())}.{file_format}"
+    if file_format == "json":
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(season, f, indent=2, ensure_ascii=False)
+    else:
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['episode', 'episode_url', 'resolution', 'host', 'url'])
+            for episode_url, episode in season.items():
+                for resolution, hosts in episode['links'].items():
+                    for host, url in hosts.items():
+                        writer.writerow([episode['title'], episode_url, resolution, host, url])
+    return filepath
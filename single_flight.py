@@ -0,0 +1,63 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from result_cache import MISSING, ResultCache
+
+class _Call:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+
+    def __init__(self, memo: Optional[ResultCache] = None):
+        self.memo = memo or ResultCache()
+        self.stats: Dict[str, int] = {"calls": 0, "shared": 0, "memo_hits": 0}
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fetch: Callable[[], Any], memo: bool = True) -> Any:
+        with self._lock:
+            self.stats["calls"] += 1
+            if memo:
+                result = self.memo.get(key)
+                if result is not MISSING:
+                    self.stats["memo_hits"] += 1
+                    return result
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.stats["shared"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fetch()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if memo and call.error is None and call.result is not None:
+                    self.memo.put(key, call.result)
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def forget(self, key: Hashable):
+        self.memo.discard(key)
+
+    def clear(self):
+        self.memo.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, "in_flight": len(self._calls)}
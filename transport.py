@@ -0,0 +1,223 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from constants import (HTTP_HEADERS, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+                       HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX,
+                       HTTP_RETRY_STATUSES, MAX_CONNECTIONS_PER_HOST,
+                       CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT,
+                       HTTP_POOL_HOSTS, HTTP_POOL_SIZE, HTTP2_ENABLED,
+                       SCHEDULER_THROTTLE_STATUSES)
+from rate_limiter import HostScheduler, get_shared_scheduler
+
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    pass
+
+class CircuitBreaker:
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            return self.state != "open"
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> bool:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def create_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    session.headers.update({'Accept-Encoding': ACCEPT_ENCODING, 'Connection': 'keep-alive'})
+    return session
+
+class Http2Session:
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE):
+        self.headers = CaseInsensitiveDict(HTTP_HEADERS)
+        self.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self._client = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    @staticmethod
+    def _timeout(timeout) -> 'httpx.Timeout':
+        if isinstance(timeout, tuple):
+            return httpx.Timeout(timeout[1], connect=timeout[0])
+        return httpx.Timeout(timeout)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout=None, **kwargs) -> requests.Response:
+        try:
+            result = self._client.get(
+                url, headers={**self.headers, **(headers or {})}, timeout=self._timeout(timeout or HTTP_READ_TIMEOUT)
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.reason = result.reason_phrase
+        response.headers = CaseInsensitiveDict(result.headers)
+        response.url = str(result.url)
+        response.encoding = result.encoding
+        response._content = result.content
+        return response
+
+class Transport:
+
+    def __init__(self, session: Optional[requests.Session] = None, max_retries: int = HTTP_MAX_RETRIES,
+                 pool_size: int = HTTP_POOL_SIZE, http2: bool = HTTP2_ENABLED,
+                 scheduler: Optional[HostScheduler] = None):
+        self.session = session or create_session(pool_size)
+        self.scheduler = scheduler or get_shared_scheduler()
+        self.client = Http2Session(pool_size) if http2 and httpx is not None else self.session
+        self.max_retries = max_retries
+        self.timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        self.metrics: Dict[str, int] = {
+            "requests": 0, "retries": 0, "failures": 0, "circuit_trips": 0, "circuit_rejections": 0, "throttled": 0,
+        }
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, metric: str):
+        with self._lock:
+            self.metrics[metric] += 1
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker()
+            return self._breakers[host]
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST)
+            return self._host_slots[host]
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, HTTP_BACKOFF_MAX)
+        return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        host = urlparse(url).netloc
+        breaker = self._breaker(host)
+        kwargs.setdefault('timeout', self.timeout)
+        client = self.session if kwargs.get('stream') else self.client
+
+        for attempt in range(self.max_retries + 1):
+            if not breaker.allow():
+                self._count("circuit_rejections")
+                raise CircuitOpenError(f"Server {host} sedang tidak dapat dihubungi, coba lagi nanti.")
+
+            self.scheduler.acquire(host)
+            self._count("requests")
+            response = None
+            try:
+                with self._host_slot(host):
+                    response = client.get(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if breaker.record_failure():
+                    self._count("circuit_trips")
+                if attempt >= self.max_retries:
+                    self._count("failures")
+                    raise
+            else:
+                if response.status_code not in HTTP_RETRY_STATUSES:
+                    breaker.record_success()
+                    self.scheduler.reward(host)
+                    return response
+                if response.status_code >= 500 and breaker.record_failure():
+                    self._count("circuit_trips")
+                if response.status_code in SCHEDULER_THROTTLE_STATUSES:
+                    self._count("throttled")
+                    self.scheduler.penalize(host, self._backoff(attempt, response))
+                if attempt >= self.max_retries:
+                    self._count("failures")
+                    return response
+                response.close()
+
+            self._count("retries")
+            if response is None or response.status_code not in SCHEDULER_THROTTLE_STATUSES:
+                time.sleep(self._backoff(attempt, response))
+
+    def get_metrics(self) -> Dict[str, int]:
+        with self._lock:
+            metrics = dict(self.metrics)
+            metrics["open_circuits"] = sum(1 for b in self._breakers.values() if b.state == "open")
+        return metrics
+
+    def get_scheduler_state(self) -> Dict[str, Dict[str, Any]]:
+        return self.scheduler.snapshot()
+
+_shared_transport: Optional[Transport] = None
+_shared_transport_lock = threading.Lock()
+
+def get_shared_transport() -> Transport:
+    global _shared_transport
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = Transport()
+        return _shared_transport
@@ -1,7 +1,8 @@
 import base64
 import os
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -28,6 +29,13 @@ def format_timestamp(ts: any) -> str:
     except (ValueError, TypeError):
         return "Timestamp tidak valid"
 
+def group_anime_by_letter(anime_list: List[Dict[str, str]]) -> Dict[str, List[Dict[str, str]]]:
+    grouped = defaultdict(list)
+    for anime in anime_list:
+        first_letter = anime['title'][0].upper() if anime['title'] else '#'
+        grouped[first_letter if first_letter.isalpha() else '#'].append(anime)
+    return {letter: grouped[letter] for letter in sorted(grouped)}
+
 def create_header(text: str, style: str = "header") -> Panel:
     return Panel(
         Text(text, justify="center", style=style),